@@ -2,11 +2,23 @@
 Absolute Resolver Component - LLM-based resolution of time slots to absolute dates/times
 """
 import json
+import re
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 from llm_setup import get_llm
 
+try:
+    import orjson
+except ImportError:  # optional speedup; not in agents/requirements.txt
+    orjson = None
+
+# Pulls the resolution object out of a reply that has prose around it
+_JSON_OBJECT_RE = re.compile(r'\{[^}]*\}')
+
+# Decoder for the resolution reply (either raises a json.JSONDecodeError)
+_json_loads = orjson.loads if orjson else json.loads
+
 
 class AbsoluteResolution(BaseModel):
     """Absolute resolution result model"""
@@ -203,7 +215,6 @@ Note: End time is 11:59 pm on same date as start, NOT start + duration
 * **WARNING: Duration is IGNORED for all calculations**
 
 ## Current Context:
-NOW_ISO: {now_iso}
 TIMEZONE: {timezone}
 TODAY_HUMAN: {today_human}
 END_OF_TODAY: {end_of_today}
@@ -211,6 +222,7 @@ END_OF_WEEK: {end_of_week}
 END_OF_MONTH: {end_of_month}
 NEXT_MONDAY: {next_monday}
 NEXT_OCCURRENCES: {next_occurrences}
+NOW_ISO: {now_iso}
 
 ## Slots to Resolve:
 {slots_json}
@@ -234,7 +246,8 @@ Resolve to absolute dates/times:
         if not slots:
             raise ValueError("Slots cannot be empty")
         
-        # Format the prompt
+        # Format the prompt. Context lines run from slowest- to fastest-changing
+        # (NOW_ISO last) so consecutive calls share the longest prompt prefix
         prompt = self.prompt_template.format(
             now_iso=context.get('NOW_ISO', ''),
             timezone=context.get('TIMEZONE', ''),
@@ -266,13 +279,12 @@ Resolve to absolute dates/times:
             
             # Parse JSON
             try:
-                resolved_data = json.loads(response_text)
-            except json.JSONDecodeError as e:
+                resolved_data = _json_loads(response_text)
+            except json.JSONDecodeError:
                 # If JSON parsing fails, try to extract JSON from the response
-                import re
-                json_match = re.search(r'\{[^}]*\}', response_text)
+                json_match = _JSON_OBJECT_RE.search(response_text)
                 if json_match:
-                    resolved_data = json.loads(json_match.group())
+                    resolved_data = _json_loads(json_match.group())
                 else:
                     raise ValueError(f"Could not parse JSON from response: {response_text}")
             
@@ -9,22 +9,29 @@ import sys
 import os
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup; not in agents/requirements.txt
+    orjson = None
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from user_query import UserQueryHandler
-from slot_extractor import SlotExtractor
-from absolute_resolver import AbsoluteResolver
-from time_standardizer import TimeStandardizer
-from task_difficulty_analyzer import TaskDifficultyAnalyzer
-from llm_decomposer import LLMDecomposer
-from time_allotment_agent import TimeAllotmentAgent
-from event_creator_agent import EventCreatorAgent
-from context_provider import ContextProvider
+# Pipeline stages are imported inside run_pipeline: they pull in the LLM
+# client stack, which --help/--list/--delete never need
+
+# A complex task always decomposes into at least two subtasks of PT15M or
+# more, and TA keeps 5 minutes between them; a window shorter than that
+# cannot hold any decomposition, so skip the LD call instead of paying for it
+MIN_DECOMPOSE_WINDOW_MINUTES = 2 * 15 + 5
+
+# Background I/O (the TD calendar lookup) that overlaps with the LLM-bound stages
+_IO_POOL = ThreadPoolExecutor(max_workers=1)
 
 
 class PipelineOrchestrator:
@@ -35,44 +42,71 @@ class PipelineOrchestrator:
         self.db_path = db_path
         self.results = {}
         self.errors = []
+        self._lines: List[str] = []
+    
+    def _emit(self, line: str = ""):
+        """Buffer one line of progress output (dropped when not verbose)"""
+        if self.verbose:
+            self._lines.append(line)
+    
+    def _flush(self):
+        """Write buffered progress output in a single call"""
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+            self._lines.clear()
         
     def _print_step_header(self, step_num: int, step_name: str, step_abbr: str):
-        """Print formatted step header"""
-        print("\n" + "=" * 80)
-        print(f"STEP {step_num}: {step_name} ({step_abbr})")
-        print("=" * 80)
+        """Print formatted step header (flushes the previous step's output)"""
+        self._emit("\n" + "=" * 80)
+        self._emit(f"STEP {step_num}: {step_name} ({step_abbr})")
+        self._emit("=" * 80)
+        self._flush()
     
     def _print_success(self, message: str):
         """Print success message"""
-        print(f"✅ {message}")
+        self._emit(f"✅ {message}")
     
     def _print_error(self, message: str):
         """Print error message"""
-        print(f"❌ {message}")
+        self._emit(f"❌ {message}")
         self.errors.append(message)
+        self._flush()
     
     def _print_info(self, message: str):
         """Print info message"""
-        print(f"ℹ️  {message}")
+        self._emit(f"ℹ️  {message}")
     
     def _print_warning(self, message: str):
         """Print warning message"""
-        print(f"⚠️  {message}")
+        self._emit(f"⚠️  {message}")
     
     def _print_data(self, label: str, data: Any, indent: int = 2):
         """Print formatted data"""
+        if not self.verbose:
+            return
         spaces = " " * indent
         if isinstance(data, dict):
-            print(f"{spaces}{label}:")
+            self._emit(f"{spaces}{label}:")
             for key, value in data.items():
                 if value is not None:
-                    print(f"{spaces}  • {key}: {value}")
+                    self._emit(f"{spaces}  • {key}: {value}")
         elif isinstance(data, list):
-            print(f"{spaces}{label}:")
+            self._emit(f"{spaces}{label}:")
             for i, item in enumerate(data, 1):
-                print(f"{spaces}  {i}. {item}")
+                self._emit(f"{spaces}  {i}. {item}")
         else:
-            print(f"{spaces}{label}: {data}")
+            self._emit(f"{spaces}{label}: {data}")
+    
+    @staticmethod
+    def _window_minutes(ts_result) -> Optional[float]:
+        """Length of the standardized scheduling window in minutes, if known"""
+        try:
+            start = datetime.fromisoformat(ts_result.start.replace('Z', '+00:00'))
+            end = datetime.fromisoformat(ts_result.end.replace('Z', '+00:00'))
+        except (AttributeError, TypeError, ValueError):
+            return None
+        return (end - start).total_seconds() / 60
     
     def run_pipeline(self, query: str, timezone: str = "America/New_York") -> Dict[str, Any]:
         """
@@ -85,12 +119,22 @@ class PipelineOrchestrator:
         Returns:
             Dictionary with all results and final status
         """
-        print("\n" + "=" * 80)
-        print("🚀 STREAMLINED AGENTS - FULL PIPELINE")
-        print("=" * 80)
-        print(f"📝 Query: {query}")
-        print(f"🌍 Timezone: {timezone}")
-        print(f"🕐 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._emit("\n" + "=" * 80)
+        self._emit("🚀 STREAMLINED AGENTS - FULL PIPELINE")
+        self._emit("=" * 80)
+        self._emit(f"📝 Query: {query}")
+        self._emit(f"🌍 Timezone: {timezone}")
+        self._emit(f"🕐 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        from user_query import UserQueryHandler
+        from slot_extractor import SlotExtractor
+        from absolute_resolver import AbsoluteResolver
+        from time_standardizer import TimeStandardizer
+        from task_difficulty_analyzer import TaskDifficultyAnalyzer
+        from llm_decomposer import LLMDecomposer
+        from time_allotment_agent import TimeAllotmentAgent
+        from event_creator_agent import EventCreatorAgent
+        from context_provider import ContextProvider
         
         # Step 1: User Query Handler
         self._print_step_header(1, "User Query Handler", "UQ")
@@ -127,6 +171,16 @@ class PipelineOrchestrator:
             self._print_error(f"SE failed: {e}")
             return {"success": False, "error": f"SE failed: {e}", "results": self.results}
         
+        # The TD calendar fetch does not depend on steps 3-4, so start it once
+        # the query and slots are in hand and let it overlap AR's LLM call.
+        # The analyzer is built here so its constructor errors stay on this thread
+        try:
+            td = TaskDifficultyAnalyzer()
+        except Exception as e:
+            self._print_error(f"TD failed: {e}")
+            return {"success": False, "error": f"TD failed: {e}", "results": self.results}
+        td_prefetch = _IO_POOL.submit(td.prefetch)
+        
         # Step 3: Absolute Resolver
         self._print_step_header(3, "Absolute Resolver", "AR")
         try:
@@ -148,6 +202,7 @@ class PipelineOrchestrator:
                 self._print_warning("AR returned None")
                 self.results["ar"] = {"start_text": None, "end_text": None, "duration": None}
         except Exception as e:
+            td_prefetch.cancel()
             self._print_error(f"AR failed: {e}")
             return {"success": False, "error": f"AR failed: {e}", "results": self.results}
         
@@ -170,13 +225,14 @@ class PipelineOrchestrator:
                 self._print_warning("TS returned None")
                 self.results["ts"] = {"start": None, "end": None, "duration": None}
         except Exception as e:
+            td_prefetch.cancel()
             self._print_error(f"TS failed: {e}")
             return {"success": False, "error": f"TS failed: {e}", "results": self.results}
         
         # Step 5: Task Difficulty Analyzer
         self._print_step_header(5, "Task Difficulty Analyzer", "TD")
         try:
-            td = TaskDifficultyAnalyzer()
+            td_prefetch.result()
             ts_dict = ts_result.to_dict() if ts_result else None
             td_result = td.analyze_safe(uq_result.query, ts_dict.get("duration") if ts_dict else None) if ts_result else None
             
@@ -184,9 +240,9 @@ class PipelineOrchestrator:
                 self.results["td"] = td_result.to_dict()
                 self._print_success("Task classified")
                 self._print_data("Result", self.results["td"])
-                print(f"  📊 Task Type: {td_result.type.upper()}")
-                print(f"  📅 Calendar: {td_result.calendar or 'N/A'}")
-                print(f"  📝 Title: {td_result.title}")
+                self._emit(f"  📊 Task Type: {td_result.type.upper()}")
+                self._emit(f"  📅 Calendar: {td_result.calendar or 'N/A'}")
+                self._emit(f"  📝 Title: {td_result.title}")
             else:
                 self._print_warning("TD returned None")
                 self.results["td"] = None
@@ -197,7 +253,14 @@ class PipelineOrchestrator:
         # Step 6: LLM Decomposer (only for complex tasks)
         self._print_step_header(6, "LLM Decomposer", "LD")
         ld_result = None
-        if td_result and td_result.type == "complex":
+        window_minutes = self._window_minutes(ts_result) if ts_result else None
+        if (td_result and td_result.type == "complex"
+                and window_minutes is not None and window_minutes < MIN_DECOMPOSE_WINDOW_MINUTES):
+            self._print_warning(
+                f"Skipped: {window_minutes:.0f} min window is too short for a complex task"
+            )
+            self.results["ld"] = None
+        elif td_result and td_result.type == "complex":
             try:
                 ld = LLMDecomposer()
                 td_dict = td_result.to_dict()
@@ -206,9 +269,9 @@ class PipelineOrchestrator:
                 if ld_result:
                     self.results["ld"] = ld_result.to_dict()
                     self._print_success(f"Task decomposed into {len(ld_result.subtasks)} subtasks")
-                    print(f"  📋 Subtasks:")
+                    self._emit(f"  📋 Subtasks:")
                     for i, subtask in enumerate(ld_result.subtasks, 1):
-                        print(f"     {i}. {subtask.title} ({subtask.duration})")
+                        self._emit(f"     {i}. {subtask.title} ({subtask.duration})")
                 else:
                     self._print_warning("LD returned None")
                     self.results["ld"] = None
@@ -235,8 +298,8 @@ class PipelineOrchestrator:
                 ta_result = ta.schedule_simple_task(td_dict, ts_dict)
                 self.results["ta"] = ta_result.to_dict()
                 self._print_success("Simple task scheduled")
-                print(f"  🆔 Task ID: {ta_result.id}")
-                print(f"  ⏰ Slot: {ta_result.slot[0]} → {ta_result.slot[1]}")
+                self._emit(f"  🆔 Task ID: {ta_result.id}")
+                self._emit(f"  ⏰ Slot: {ta_result.slot[0]} → {ta_result.slot[1]}")
                 
             elif ld_result and ld_result.type == "complex":
                 ld_dict = ld_result.to_dict()
@@ -248,12 +311,12 @@ class PipelineOrchestrator:
                 ta_result = ta.schedule_complex_task(ld_dict, ts_dict)
                 self.results["ta"] = ta_result.to_dict()
                 self._print_success(f"Complex task scheduled with {len(ta_result.subtasks)} subtasks")
-                print(f"  🆔 Parent ID: {ta_result.id}")
-                print(f"  📋 Subtasks:")
+                self._emit(f"  🆔 Parent ID: {ta_result.id}")
+                self._emit(f"  📋 Subtasks:")
                 for i, subtask in enumerate(ta_result.subtasks, 1):
-                    print(f"     {i}. {subtask.title}")
-                    print(f"        Slot: {subtask.slot[0]} → {subtask.slot[1]}")
-                    print(f"        ID: {subtask.id}")
+                    self._emit(f"     {i}. {subtask.title}")
+                    self._emit(f"        Slot: {subtask.slot[0]} → {subtask.slot[1]}")
+                    self._emit(f"        ID: {subtask.id}")
             else:
                 self._print_warning("Cannot schedule: missing TD or LD output")
                 self.results["ta"] = None
@@ -266,43 +329,44 @@ class PipelineOrchestrator:
         self._print_step_header(8, "Event Creator Agent", "EC")
         ec_result = None
         try:
-            ec = EventCreatorAgent(db_path=self.db_path)
-            
             if ta_result:
-                ta_dict = ta_result.to_dict()
-                
-                if ta_dict.get("type") == "simple":
-                    create_result = ec.create_simple_task(ta_dict)
-                    if create_result.success:
+                # Opening the agent initializes the SQLite schema; skip it when
+                # there is nothing to create
+                with EventCreatorAgent(db_path=self.db_path) as ec:
+                    ta_dict = ta_result.to_dict()
+                    
+                    if ta_dict.get("type") == "simple":
+                        create_result = ec.create_simple_task(ta_dict)
+                        if create_result.success:
+                            ec_result = {
+                                "success": True,
+                                "type": "simple",
+                                "task_id": create_result.task_id,
+                                "calendar_event_id": create_result.calendar_event_id
+                            }
+                            self._print_success("Simple task event created")
+                            self._emit(f"  🆔 Task ID: {create_result.task_id}")
+                            self._emit(f"  📅 Calendar Event ID: {create_result.calendar_event_id}")
+                        else:
+                            ec_result = {"success": False, "error": create_result.error}
+                            self._print_error(f"Event creation failed: {create_result.error}")
+                    
+                    elif ta_dict.get("type") == "complex":
+                        create_result = ec.create_complex_task(ta_dict)
                         ec_result = {
-                            "success": True,
-                            "type": "simple",
-                            "task_id": create_result.task_id,
-                            "calendar_event_id": create_result.calendar_event_id
+                            "success": create_result["success"],
+                            "type": "complex",
+                            "created": create_result.get("created", []),
+                            "failed": create_result.get("failed", [])
                         }
-                        self._print_success("Simple task event created")
-                        print(f"  🆔 Task ID: {create_result.task_id}")
-                        print(f"  📅 Calendar Event ID: {create_result.calendar_event_id}")
-                    else:
-                        ec_result = {"success": False, "error": create_result.error}
-                        self._print_error(f"Event creation failed: {create_result.error}")
-                
-                elif ta_dict.get("type") == "complex":
-                    create_result = ec.create_complex_task(ta_dict)
-                    ec_result = {
-                        "success": create_result["success"],
-                        "type": "complex",
-                        "created": create_result.get("created", []),
-                        "failed": create_result.get("failed", [])
-                    }
-                    if create_result["success"]:
-                        self._print_success(f"Created {len(create_result['created'])} subtask events")
-                        for item in create_result["created"]:
-                            print(f"  📅 Task {item['task_id']}: Event {item['calendar_event_id']}")
-                    else:
-                        self._print_warning(f"Partial failure: {len(create_result.get('failed', []))} failed")
-                        for item in create_result.get("failed", []):
-                            print(f"  ❌ Task {item['task_id']}: {item.get('error', 'Unknown error')}")
+                        if create_result["success"]:
+                            self._print_success(f"Created {len(create_result['created'])} subtask events")
+                            for item in create_result["created"]:
+                                self._emit(f"  📅 Task {item['task_id']}: Event {item['calendar_event_id']}")
+                        else:
+                            self._print_warning(f"Partial failure: {len(create_result.get('failed', []))} failed")
+                            for item in create_result.get("failed", []):
+                                self._emit(f"  ❌ Task {item['task_id']}: {item.get('error', 'Unknown error')}")
             else:
                 self._print_warning("Cannot create events: missing TA output")
                 ec_result = None
@@ -324,9 +388,11 @@ class PipelineOrchestrator:
     
     def _print_summary(self):
         """Print final summary"""
-        print("\n" + "=" * 80)
-        print("📊 PIPELINE SUMMARY")
-        print("=" * 80)
+        if not self.verbose:
+            return
+        self._emit("\n" + "=" * 80)
+        self._emit("📊 PIPELINE SUMMARY")
+        self._emit("=" * 80)
         
         # Check each step
         steps = [
@@ -342,26 +408,304 @@ class PipelineOrchestrator:
         
         for abbr, name, result in steps:
             if result is not None:
-                print(f"✅ {abbr}: {name}")
+                self._emit(f"✅ {abbr}: {name}")
             else:
-                print(f"⚠️  {abbr}: {name} (skipped or failed)")
+                self._emit(f"⚠️  {abbr}: {name} (skipped or failed)")
         
         # Final result
         ec_result = self.results.get("ec")
         if ec_result and isinstance(ec_result, dict) and ec_result.get("success"):
-            print("\n" + "🎉 SUCCESS: Calendar events created!")
+            self._emit("\n" + "🎉 SUCCESS: Calendar events created!")
             if ec_result.get("type") == "simple":
-                print(f"   📅 Event ID: {ec_result.get('calendar_event_id')}")
+                self._emit(f"   📅 Event ID: {ec_result.get('calendar_event_id')}")
             else:
-                print(f"   📅 Created {len(ec_result.get('created', []))} events")
+                self._emit(f"   📅 Created {len(ec_result.get('created', []))} events")
         else:
-            print("\n" + "❌ FAILED: Could not create calendar events")
+            self._emit("\n" + "❌ FAILED: Could not create calendar events")
             if self.errors:
-                print("   Errors:")
+                self._emit("   Errors:")
                 for error in self.errors:
-                    print(f"     • {error}")
+                    self._emit(f"     • {error}")
+        
+        self._emit("=" * 80)
+        self._flush()
+
+
+def _json_dumps(obj: Any) -> str:
+    """Pretty-print JSON output, via orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+def _timezone_arg(value: str) -> str:
+    """argparse type for --timezone: reject unknown zones before any LLM call"""
+    import pytz
+    try:
+        pytz.timezone(value)
+    except pytz.UnknownTimeZoneError:
+        raise argparse.ArgumentTypeError(f"unknown timezone: {value}")
+    return value
+
+
+def _list_command(args: argparse.Namespace):
+    """List all events in the database"""
+    from event_creator_agent import EventCreatorAgent
+    with EventCreatorAgent(db_path=args.db_path) as agent:
+        events = agent.list_events()
+    
+    if not events:
+        print("📭 No events found in the database")
+        return
+    
+    # Build the listing in memory and write it once
+    parts = [
+        "",
+        "=" * 80,
+        "📋 EVENTS IN DATABASE",
+        "=" * 80,
+        f"Total: {len(events)} event(s)\n",
+    ]
+    
+    # Group by parent tasks
+    parent_tasks = [e for e in events if e["type"] == "parent"]
+    simple_tasks = [e for e in events if e["type"] == "simple"]
+    subtasks = [e for e in events if e["type"] == "subtask"]
+    
+    # Print parent tasks with their children
+    for parent in parent_tasks:
+        parts.append(f"📁 PARENT: {parent['title']}")
+        parts.append(f"   ID: {parent['task_id']}")
+        parts.append(f"   Children: {parent['child_count']}")
+        parts.append(f"   Has Event: {'No' if not parent['has_event'] else 'Yes (parent tasks have no calendar events)'}")
+        parts.append("")
+        
+        # Print children
+        children = [e for e in subtasks if e['parent_id'] == parent['task_id']]
+        for i, child in enumerate(children, 1):
+            parts.append(f"   └─ {i}. {child['title']}")
+            parts.append(f"      ID: {child['task_id']}")
+            if child['has_event']:
+                parts.append(f"      Calendar Event ID: {child['calendar_event_id']}")
+                parts.append(f"      Calendar ID: {child['calendar_id']}")
+            else:
+                parts.append(f"      Calendar Event: None")
+            parts.append("")
+    
+    # Print simple tasks
+    for task in simple_tasks:
+        parts.append(f"📝 SIMPLE: {task['title']}")
+        parts.append(f"   ID: {task['task_id']}")
+        if task['has_event']:
+            parts.append(f"   Calendar Event ID: {task['calendar_event_id']}")
+            parts.append(f"   Calendar ID: {task['calendar_id']}")
+        else:
+            parts.append(f"   Calendar Event: None")
+        parts.append("")
+    
+    # Print orphaned subtasks (if any)
+    parent_ids = {p['task_id'] for p in parent_tasks}
+    orphaned = [e for e in subtasks if e['parent_id'] not in parent_ids]
+    if orphaned:
+        parts.append("⚠️  ORPHANED SUBTASKS (parent not found):")
+        for task in orphaned:
+            parts.append(f"   • {task['title']} (ID: {task['task_id']}, Parent: {task['parent_id']})")
+        parts.append("")
+    
+    sys.stdout.write("\n".join(parts) + "\n")
+    
+    if args.json:
+        print("\n" + "=" * 80)
+        print("📄 JSON OUTPUT")
+        print("=" * 80)
+        print(_json_dumps(events))
+
+
+def _delete_command(args: argparse.Namespace):
+    """Delete a task by ID (cascade if parent)"""
+    from event_creator_agent import EventCreatorAgent
+    print("\n" + "=" * 80)
+    print(f"🗑️  DELETING TASK: {args.delete}")
+    print("=" * 80)
+    
+    with EventCreatorAgent(db_path=args.db_path) as agent:
+        result = agent.delete_by_id(args.delete)
+    
+    if result.deleted:
+        print(f"✅ Successfully deleted {len(result.deleted)} task(s):")
+        for item in result.deleted:
+            print(f"   • Task ID: {item['task_id']}")
+            if item.get('calendar_event_id'):
+                print(f"     Calendar Event ID: {item['calendar_event_id']}")
+    
+    if result.skipped:
+        print(f"⚠️  Skipped {len(result.skipped)} task(s):")
+        for item in result.skipped:
+            print(f"   • Task ID: {item['task_id']}")
+            print(f"     Reason: {item.get('reason', 'Unknown')}")
+    
+    if result.errors:
+        print(f"❌ Errors deleting {len(result.errors)} task(s):")
+        for item in result.errors:
+            print(f"   • Task ID: {item['task_id']}")
+            print(f"     Error: {item.get('reason', 'Unknown error')}")
+    
+    if not result.deleted and not result.skipped and not result.errors:
+        print("⚠️  No tasks found to delete")
+    
+    if args.json:
+        print("\n" + "=" * 80)
+        print("📄 JSON OUTPUT")
+        print("=" * 80)
+        print(_json_dumps(result.to_dict()))
+
+
+def _delete_parent_command(args: argparse.Namespace):
+    """Delete all children of a parent task, then the parent"""
+    from event_creator_agent import EventCreatorAgent
+    print("\n" + "=" * 80)
+    print(f"🗑️  DELETING CHILDREN OF PARENT: {args.delete_parent}")
+    print("=" * 80)
+    
+    with EventCreatorAgent(db_path=args.db_path) as agent:
+        result = agent.delete_by_parent_id(args.delete_parent)
+    
+    if result.deleted:
+        print(f"✅ Successfully deleted {len(result.deleted)} subtask(s):")
+        for item in result.deleted:
+            print(f"   • Task ID: {item['task_id']}")
+            if item.get('calendar_event_id'):
+                print(f"     Calendar Event ID: {item['calendar_event_id']}")
+        print(f"   Parent task also deleted")
+    
+    if result.skipped:
+        print(f"⚠️  Skipped {len(result.skipped)} task(s):")
+        for item in result.skipped:
+            print(f"   • Task ID: {item['task_id']}")
+            print(f"     Reason: {item.get('reason', 'Unknown')}")
+    
+    if result.errors:
+        print(f"❌ Errors deleting {len(result.errors)} task(s):")
+        for item in result.errors:
+            print(f"   • Task ID: {item['task_id']}")
+            print(f"     Error: {item.get('reason', 'Unknown error')}")
+    
+    if not result.deleted and not result.skipped and not result.errors:
+        print("⚠️  No tasks found to delete")
+    
+    if args.json:
+        print("\n" + "=" * 80)
+        print("📄 JSON OUTPUT")
+        print("=" * 80)
+        print(_json_dumps(result.to_dict()))
+
+
+def _delete_all_command(args: argparse.Namespace):
+    """Delete all events from the calendar and the database"""
+    from event_creator_agent import EventCreatorAgent
+    with EventCreatorAgent(db_path=args.db_path) as agent:
+        # Get confirmation
+        print("\n" + "=" * 80)
+        print("⚠️  WARNING: DELETE ALL EVENTS")
+        print("=" * 80)
+        print("This will delete ALL events from:")
+        print("  1. The calendar (via CalBridge API)")
+        print("  2. The database (tasks and event_map tables)")
+        print("\nThis action CANNOT be undone!")
+        print("=" * 80)
         
+        # List current events
+        events = agent.list_events()
+        if events:
+            print(f"\n📋 Current events in database: {len(events)}")
+            print("\nEvents to be deleted:")
+            for event in events:
+                if event["has_event"]:
+                    print(f"   • {event['title']} (ID: {event['task_id']}, Event: {event['calendar_event_id']})")
+                else:
+                    print(f"   • {event['title']} (ID: {event['task_id']}, No calendar event)")
+        else:
+            print("\n📭 No events found in database")
+            return
+        
+        # Ask for confirmation
+        confirm = input("\nAre you sure you want to delete ALL events? (type 'yes' to confirm): ").strip().lower()
+        
+        if confirm != 'yes':
+            print("❌ Operation cancelled")
+            return
+        
+        print("\n" + "=" * 80)
+        print("🗑️  DELETING ALL EVENTS")
+        print("=" * 80)
+        
+        result = agent.delete_all_events()
+    
+    if result.deleted:
+        print(f"\n✅ Successfully deleted {len(result.deleted)} calendar event(s):")
+        for item in result.deleted:
+            print(f"   • Task ID: {item['task_id']}")
+            if item.get('calendar_event_id'):
+                print(f"     Calendar Event ID: {item['calendar_event_id']}")
+    
+    if result.skipped:
+        print(f"\n⚠️  Skipped {len(result.skipped)} event(s) (already deleted):")
+        for item in result.skipped:
+            print(f"   • Task ID: {item['task_id']}")
+    
+    if result.errors:
+        print(f"\n❌ Errors deleting {len(result.errors)} event(s):")
+        for item in result.errors:
+            print(f"   • Task ID: {item.get('task_id', 'Unknown')}")
+            print(f"     Error: {item.get('reason', 'Unknown error')}")
+    
+    # delete_all_events clears both tables in one transaction and reports a
+    # database failure as an error against "all", so no re-read is needed
+    db_failed = any(item.get("task_id") == "all" for item in result.errors)
+    if db_failed:
+        print(f"\n⚠️  Warning: {len(events)} event(s) still remain in database")
+    else:
+        print("\n✅ All database entries have been deleted")
+    print("=" * 80)
+    
+    if args.json:
+        print("\n" + "=" * 80)
+        print("📄 JSON OUTPUT")
         print("=" * 80)
+        print(_json_dumps(result.to_dict()))
+
+
+def _interactive_command(args: argparse.Namespace):
+    """Prompt for queries until the user quits"""
+    print("🚀 Streamlined Agents - Interactive Mode")
+    print("Enter queries (or 'quit' to exit):\n")
+    
+    orchestrator = PipelineOrchestrator(verbose=not args.quiet, db_path=args.db_path)
+    
+    while True:
+        try:
+            query = input("📝 Query: ").strip()
+            if not query or query.lower() in ['quit', 'exit', 'q']:
+                print("👋 Goodbye!")
+                break
+            
+            orchestrator.run_pipeline(query, args.timezone)
+            print("\n" + "-" * 80 + "\n")
+            
+        except KeyboardInterrupt:
+            print("\n\n👋 Goodbye!")
+            break
+        except Exception as e:
+            print(f"\n❌ Error: {e}\n")
+
+
+COMMANDS = {
+    "list": _list_command,
+    "delete": _delete_command,
+    "delete_parent": _delete_parent_command,
+    "delete_all": _delete_all_command,
+    "interactive": _interactive_command,
+}
 
 
 def main():
@@ -394,6 +738,7 @@ Examples:
     parser.add_argument(
         "--timezone",
         "-t",
+        type=_timezone_arg,
         default="America/New_York",
         help="Timezone for processing (default: America/New_York)"
     )
@@ -411,6 +756,13 @@ Examples:
         help="Output final result as JSON"
     )
     
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Suppress per-stage progress output"
+    )
+    
     parser.add_argument(
         "--list",
         "-l",
@@ -439,277 +791,25 @@ Examples:
     
     args = parser.parse_args()
     
-    # List events mode
-    if args.list:
-        from event_creator_agent import EventCreatorAgent
-        agent = EventCreatorAgent(db_path=args.db_path)
-        events = agent.list_events()
-        
-        if not events:
-            print("📭 No events found in the database")
-            return
-        
-        print("\n" + "=" * 80)
-        print("📋 EVENTS IN DATABASE")
-        print("=" * 80)
-        print(f"Total: {len(events)} event(s)\n")
-        
-        # Group by parent tasks
-        parent_tasks = [e for e in events if e["type"] == "parent"]
-        simple_tasks = [e for e in events if e["type"] == "simple"]
-        subtasks = [e for e in events if e["type"] == "subtask"]
-        
-        # Print parent tasks with their children
-        for parent in parent_tasks:
-            print(f"📁 PARENT: {parent['title']}")
-            print(f"   ID: {parent['task_id']}")
-            print(f"   Children: {parent['child_count']}")
-            print(f"   Has Event: {'No' if not parent['has_event'] else 'Yes (parent tasks have no calendar events)'}")
-            print()
-            
-            # Print children
-            children = [e for e in subtasks if e['parent_id'] == parent['task_id']]
-            for i, child in enumerate(children, 1):
-                print(f"   └─ {i}. {child['title']}")
-                print(f"      ID: {child['task_id']}")
-                if child['has_event']:
-                    print(f"      Calendar Event ID: {child['calendar_event_id']}")
-                    print(f"      Calendar ID: {child['calendar_id']}")
-                else:
-                    print(f"      Calendar Event: None")
-                print()
-        
-        # Print simple tasks
-        for task in simple_tasks:
-            print(f"📝 SIMPLE: {task['title']}")
-            print(f"   ID: {task['task_id']}")
-            if task['has_event']:
-                print(f"   Calendar Event ID: {task['calendar_event_id']}")
-                print(f"   Calendar ID: {task['calendar_id']}")
-            else:
-                print(f"   Calendar Event: None")
-            print()
-        
-        # Print orphaned subtasks (if any)
-        orphaned = [e for e in subtasks if e['parent_id'] not in [p['task_id'] for p in parent_tasks]]
-        if orphaned:
-            print("⚠️  ORPHANED SUBTASKS (parent not found):")
-            for task in orphaned:
-                print(f"   • {task['title']} (ID: {task['task_id']}, Parent: {task['parent_id']})")
-            print()
-        
-        if args.json:
-            print("\n" + "=" * 80)
-            print("📄 JSON OUTPUT")
-            print("=" * 80)
-            print(json.dumps(events, indent=2, default=str))
-        
-        return
-    
-    # Delete by ID mode
-    if args.delete:
-        from event_creator_agent import EventCreatorAgent
-        agent = EventCreatorAgent(db_path=args.db_path)
-        
-        print("\n" + "=" * 80)
-        print(f"🗑️  DELETING TASK: {args.delete}")
-        print("=" * 80)
-        
-        result = agent.delete_by_id(args.delete)
-        
-        if result.deleted:
-            print(f"✅ Successfully deleted {len(result.deleted)} task(s):")
-            for item in result.deleted:
-                print(f"   • Task ID: {item['task_id']}")
-                if item.get('calendar_event_id'):
-                    print(f"     Calendar Event ID: {item['calendar_event_id']}")
-        
-        if result.skipped:
-            print(f"⚠️  Skipped {len(result.skipped)} task(s):")
-            for item in result.skipped:
-                print(f"   • Task ID: {item['task_id']}")
-                print(f"     Reason: {item.get('reason', 'Unknown')}")
-        
-        if result.errors:
-            print(f"❌ Errors deleting {len(result.errors)} task(s):")
-            for item in result.errors:
-                print(f"   • Task ID: {item['task_id']}")
-                print(f"     Error: {item.get('reason', 'Unknown error')}")
-        
-        if not result.deleted and not result.skipped and not result.errors:
-            print("⚠️  No tasks found to delete")
-        
-        if args.json:
-            print("\n" + "=" * 80)
-            print("📄 JSON OUTPUT")
-            print("=" * 80)
-            print(json.dumps(result.to_dict(), indent=2, default=str))
-        
-        return
-    
-    # Delete by parent ID mode
-    if args.delete_parent:
-        from event_creator_agent import EventCreatorAgent
-        agent = EventCreatorAgent(db_path=args.db_path)
-        
-        print("\n" + "=" * 80)
-        print(f"🗑️  DELETING CHILDREN OF PARENT: {args.delete_parent}")
-        print("=" * 80)
-        
-        result = agent.delete_by_parent_id(args.delete_parent)
-        
-        if result.deleted:
-            print(f"✅ Successfully deleted {len(result.deleted)} subtask(s):")
-            for item in result.deleted:
-                print(f"   • Task ID: {item['task_id']}")
-                if item.get('calendar_event_id'):
-                    print(f"     Calendar Event ID: {item['calendar_event_id']}")
-            print(f"   Parent task also deleted")
-        
-        if result.skipped:
-            print(f"⚠️  Skipped {len(result.skipped)} task(s):")
-            for item in result.skipped:
-                print(f"   • Task ID: {item['task_id']}")
-                print(f"     Reason: {item.get('reason', 'Unknown')}")
-        
-        if result.errors:
-            print(f"❌ Errors deleting {len(result.errors)} task(s):")
-            for item in result.errors:
-                print(f"   • Task ID: {item['task_id']}")
-                print(f"     Error: {item.get('reason', 'Unknown error')}")
-        
-        if not result.deleted and not result.skipped and not result.errors:
-            print("⚠️  No tasks found to delete")
-        
-        if args.json:
-            print("\n" + "=" * 80)
-            print("📄 JSON OUTPUT")
-            print("=" * 80)
-            print(json.dumps(result.to_dict(), indent=2, default=str))
-        
-        return
-    
-    # Delete all events mode
-    if args.delete_all:
-        from event_creator_agent import EventCreatorAgent
-        agent = EventCreatorAgent(db_path=args.db_path)
-        
-        # Get confirmation
-        print("\n" + "=" * 80)
-        print("⚠️  WARNING: DELETE ALL EVENTS")
-        print("=" * 80)
-        print("This will delete ALL events from:")
-        print("  1. The calendar (via CalBridge API)")
-        print("  2. The database (tasks and event_map tables)")
-        print("\nThis action CANNOT be undone!")
-        print("=" * 80)
-        
-        # List current events
-        events = agent.list_events()
-        if events:
-            print(f"\n📋 Current events in database: {len(events)}")
-            print("\nEvents to be deleted:")
-            for event in events:
-                if event["has_event"]:
-                    print(f"   • {event['title']} (ID: {event['task_id']}, Event: {event['calendar_event_id']})")
-                else:
-                    print(f"   • {event['title']} (ID: {event['task_id']}, No calendar event)")
-        else:
-            print("\n📭 No events found in database")
-            return
-        
-        # Ask for confirmation
-        confirm = input("\nAre you sure you want to delete ALL events? (type 'yes' to confirm): ").strip().lower()
-        
-        if confirm != 'yes':
-            print("❌ Operation cancelled")
-            return
-        
-        print("\n" + "=" * 80)
-        print("🗑️  DELETING ALL EVENTS")
-        print("=" * 80)
-        
-        result = agent.delete_all_events()
-        
-        if result.deleted:
-            print(f"\n✅ Successfully deleted {len(result.deleted)} calendar event(s):")
-            for item in result.deleted:
-                print(f"   • Task ID: {item['task_id']}")
-                if item.get('calendar_event_id'):
-                    print(f"     Calendar Event ID: {item['calendar_event_id']}")
-        
-        if result.skipped:
-            print(f"\n⚠️  Skipped {len(result.skipped)} event(s) (already deleted):")
-            for item in result.skipped:
-                print(f"   • Task ID: {item['task_id']}")
-        
-        if result.errors:
-            print(f"\n❌ Errors deleting {len(result.errors)} event(s):")
-            for item in result.errors:
-                print(f"   • Task ID: {item.get('task_id', 'Unknown')}")
-                print(f"     Error: {item.get('reason', 'Unknown error')}")
-        
-        print("\n✅ All database entries have been deleted")
-        print("=" * 80)
-        
-        # Verify database is empty
-        remaining_events = agent.list_events()
-        if remaining_events:
-            print(f"\n⚠️  Warning: {len(remaining_events)} event(s) still remain in database")
-        else:
-            print("\n✅ Database is now empty")
-        
-        if args.json:
-            print("\n" + "=" * 80)
-            print("📄 JSON OUTPUT")
-            print("=" * 80)
-            print(json.dumps(result.to_dict(), indent=2, default=str))
-        
+    # Database and interactive modes (first flag set wins, in this order)
+    mode = next((name for name in COMMANDS if getattr(args, name)), None)
+    if mode:
+        COMMANDS[mode](args)
         return
     
-    # Interactive mode
-    if args.interactive:
-        print("🚀 Streamlined Agents - Interactive Mode")
-        print("Enter queries (or 'quit' to exit):\n")
-        
-        orchestrator = PipelineOrchestrator(db_path=args.db_path)
-        
-        while True:
-            try:
-                query = input("📝 Query: ").strip()
-                if not query or query.lower() in ['quit', 'exit', 'q']:
-                    print("👋 Goodbye!")
-                    break
-                
-                orchestrator.run_pipeline(query, args.timezone)
-                print("\n" + "-" * 80 + "\n")
-                
-            except KeyboardInterrupt:
-                print("\n\n👋 Goodbye!")
-                break
-            except Exception as e:
-                print(f"\n❌ Error: {e}\n")
-        
-        return
-    
-    # Single query mode
-    if not args.query and not args.list and not args.delete and not args.delete_parent and not args.delete_all:
+    # Single query mode; every other mode was dispatched above
+    if not args.query:
         parser.print_help()
         sys.exit(1)
     
-    if not args.query:
-        # If no query but other flags were provided, they should have been handled above
-        # This is a fallback
-        sys.exit(0)
-    
-    orchestrator = PipelineOrchestrator(db_path=args.db_path)
+    orchestrator = PipelineOrchestrator(verbose=not args.quiet, db_path=args.db_path)
     result = orchestrator.run_pipeline(args.query, args.timezone)
     
     if args.json:
         print("\n" + "=" * 80)
         print("📄 JSON OUTPUT")
         print("=" * 80)
-        print(json.dumps(result, indent=2, default=str))
+        print(_json_dumps(result))
     
     sys.exit(0 if result["success"] else 1)
 
@@ -7,13 +7,84 @@ This agent:
 3. Handles deletion (by id or parent_id with cascade)
 4. Maintains event_map for tracking calendar events
 """
+import json
+import random
 import sqlite3
+import threading
 import time
+import uuid
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # optional speedup; not in agents/requirements.txt
+    orjson = None
+
+
+# Concurrent per-subtask POSTs when /add_batch is unavailable; each worker
+# thread gets its own keep-alive session (see EventCreatorAgent.session)
+MAX_PARALLEL_POSTS = 4
+
+# (connect, read) timeouts for CalBridge calls: a helper that is not running
+# fails fast, while a slow EventKit save still gets the full read budget
+CALBRIDGE_TIMEOUT = (3.0, 10.0)
+
+# Base retry delays (100ms, 500ms, 2s); each sleep adds up to 50% jitter so
+# concurrent retries from the parallel POSTs do not hit the helper in lockstep
+_BACKOFF_DELAYS = (0.1, 0.5, 2.0)
+
+
+def _backoff_sleep(attempt: int):
+    """Sleep before retry number attempt + 1"""
+    delay = _BACKOFF_DELAYS[min(attempt, len(_BACKOFF_DELAYS) - 1)]
+    time.sleep(delay * (1 + random.random() * 0.5))
+
+
+# Decoder for the json_group_array() child lists read back from SQLite
+_json_loads = orjson.loads if orjson else json.loads
+
+# event_map schema, shared by _SCHEMA_DDL and the cascade migration
+_EVENT_MAP_DDL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        task_id TEXT PRIMARY KEY,
+        calendar_id TEXT NOT NULL,
+        calendar_event_id TEXT NOT NULL,
+        FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE,
+        UNIQUE(calendar_id, calendar_event_id)
+    )
+"""
+
+# Bump when the DDL below changes; stored in the file's PRAGMA user_version
+_SCHEMA_VERSION = 1
+
+_SCHEMA_DDL = """
+    CREATE TABLE IF NOT EXISTS tasks (
+        id TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        parent_id TEXT NULL
+    );
+    
+    -- Mappings go away with their task row
+    {event_map};
+    
+    -- Child lookups (delete cascades, list_events child counts) filter on
+    -- parent_id; event_map.task_id is already covered by its primary key
+    CREATE INDEX IF NOT EXISTS idx_tasks_parent_id ON tasks(parent_id);
+""".format(event_map=_EVENT_MAP_DDL.format(table="event_map").strip())
+
+# Upserts shared by the simple and complex create paths; one SQL string each
+# so sqlite3's per-connection statement cache reuses a single prepared copy
+_UPSERT_TASK_SQL = "INSERT OR REPLACE INTO tasks (id, title, parent_id) VALUES (?, ?, ?)"
+_UPSERT_EVENT_MAP_SQL = (
+    "INSERT OR REPLACE INTO event_map (task_id, calendar_id, calendar_event_id) "
+    "VALUES (?, ?, ?)"
+)
 
 
 @dataclass
@@ -73,47 +144,156 @@ class EventCreatorAgent:
         
         Args:
             calbridge_base_url: Base URL for CalBridge API
-            db_path: Path to SQLite database (default: event_creator.db in current dir)
+            db_path: Path to SQLite database (default: event_creator.db in current dir),
+                or ":memory:" for a private in-memory database
         """
         self.calbridge_base_url = calbridge_base_url
         
+        # Keep-alive sessions so create/delete loops reuse a connection; one
+        # per thread (see the session property). Retries stay in the
+        # _calbridge_*_with_retry helpers
+        self._http = threading.local()
+        self._open_sessions: List[requests.Session] = []
+        self._open_lock = threading.Lock()
+        
         # Set up database
         if db_path is None:
             db_path = str(Path(__file__).parent / "event_creator.db")
         self.db_path = db_path
+        
+        # A plain ":memory:" connect gives every connection its own empty
+        # database; use a named shared-cache one instead so the schema and
+        # per-thread connections all see the same tables, and hold one
+        # connection open for the agent's lifetime to keep it alive
+        self._db_uri = None
+        self._memory_anchor: Optional[sqlite3.Connection] = None
+        if db_path == ":memory:":
+            self._db_uri = f"file:event_creator_{uuid.uuid4().hex}?mode=memory&cache=shared"
+            self._memory_anchor = self._connect()
+        # Cheap on an existing file: _init_database stops at PRAGMA user_version
         self._init_database()
+        
+        # One writable and one query_only connection per thread, opened on
+        # first use and kept until close(); every one is also tracked here so
+        # close() reaches connections opened by worker threads
+        self._local = threading.local()
+        self._open_conns: List[sqlite3.Connection] = []
+    
+    @property
+    def session(self) -> requests.Session:
+        """
+        The calling thread's CalBridge session, created on first use
+        
+        requests does not document Session as thread-safe, and the parallel
+        POST fallback calls in from worker threads, so sessions are not shared.
+        """
+        session = getattr(self._http, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            self._http.session = session
+            with self._open_lock:
+                self._open_sessions.append(session)
+        return session
+    
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        """Open a new connection to this agent's database"""
+        if self._db_uri is not None:
+            return sqlite3.connect(self._db_uri, uri=True, **kwargs)
+        return sqlite3.connect(self.db_path, **kwargs)
     
     def _init_database(self):
         """Initialize SQLite database with tasks and event_map tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create tasks table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tasks (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                parent_id TEXT NULL
-            )
-        """)
-        
-        # Create event_map table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS event_map (
-                task_id TEXT PRIMARY KEY,
-                calendar_id TEXT NOT NULL,
-                calendar_event_id TEXT NOT NULL,
-                FOREIGN KEY (task_id) REFERENCES tasks(id),
-                UNIQUE(calendar_id, calendar_event_id)
-            )
-        """)
+        conn = self._connect()
+        
+        # Up-to-date databases skip the DDL entirely
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+            conn.close()
+            return
+        
+        # WAL lets list/read calls proceed while a create/delete holds the
+        # write lock; the setting is persistent for the database file
+        conn.execute("PRAGMA journal_mode=WAL")
+        
+        # Create tables and indexes in one script
+        conn.executescript(_SCHEMA_DDL)
+        
+        # Databases created before the cascade was added keep the old foreign
+        # key; SQLite cannot alter it in place, so rebuild the table once
+        fk = conn.execute("PRAGMA foreign_key_list(event_map)").fetchone()
+        if fk is not None and fk[6].upper() != "CASCADE":
+            conn.execute("BEGIN")
+            conn.execute(_EVENT_MAP_DDL.format(table="event_map_new"))
+            conn.execute("""
+                INSERT INTO event_map_new (task_id, calendar_id, calendar_event_id)
+                SELECT task_id, calendar_id, calendar_event_id FROM event_map
+            """)
+            conn.execute("DROP TABLE event_map")
+            conn.execute("ALTER TABLE event_map_new RENAME TO event_map")
         
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
         conn.commit()
         conn.close()
     
-    def _get_db_connection(self) -> sqlite3.Connection:
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+    def _get_db_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Get the cached database connection for the calling thread
+        
+        Args:
+            read_only: Use the query_only connection, for list paths
+            
+        Returns:
+            SQLite connection that waits up to 5s on a busy writer. Callers
+            must not close it; it is reused until close() is called.
+        """
+        conns = self._local.__dict__.setdefault("conns", {})
+        conn = conns.get(read_only)
+        if conn is not None:
+            return conn
+        
+        # Only the owning thread uses it; check_same_thread is off so that
+        # close() may close it from whichever thread ends the agent
+        conn = self._connect(timeout=5.0, check_same_thread=False)
+        # Per-connection settings: under WAL, NORMAL only syncs at checkpoints
+        # and stays durable against application crashes; temp b-trees for
+        # sorts/joins stay in memory; FOREIGN KEY clauses are enforced
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA foreign_keys = ON")
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        conns[read_only] = conn
+        with self._open_lock:
+            self._open_conns.append(conn)
+        return conn
+    
+    def close(self):
+        """
+        Close every cached database connection and HTTP session, from all threads
+        
+        For a ":memory:" agent this also discards the database.
+        """
+        with self._open_lock:
+            conns, self._open_conns = self._open_conns, []
+            sessions, self._open_sessions = self._open_sessions, []
+        # Fresh thread-local state, so a later call reopens rather than
+        # reusing a closed connection
+        self._local = threading.local()
+        self._http = threading.local()
+        for conn in conns:
+            conn.close()
+        for session in sessions:
+            session.close()
+        # Last reference to a ":memory:" database; closing it frees the data
+        if self._memory_anchor is not None:
+            self._memory_anchor.close()
+            self._memory_anchor = None
+    
+    def __enter__(self) -> "EventCreatorAgent":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
     
     def _calbridge_post_with_retry(self, 
                                    payload: Dict[str, Any],
@@ -128,14 +308,12 @@ class EventCreatorAgent:
         Returns:
             (success, response_data, error_message)
         """
-        backoff_delays = [0.1, 0.5, 2.0]  # 100ms, 500ms, 2s
-        
         for attempt in range(max_retries):
             try:
-                response = requests.post(
+                response = self.session.post(
                     f"{self.calbridge_base_url}/add",
                     json=payload,
-                    timeout=10
+                    timeout=CALBRIDGE_TIMEOUT
                 )
                 
                 if response.status_code == 200:
@@ -146,18 +324,52 @@ class EventCreatorAgent:
                 else:
                     # 5xx errors - retry
                     if attempt < max_retries - 1:
-                        time.sleep(backoff_delays[attempt])
+                        _backoff_sleep(attempt)
                         continue
                     return False, None, f"CalBridge server error {response.status_code}: {response.text}"
                     
             except requests.RequestException as e:
                 if attempt < max_retries - 1:
-                    time.sleep(backoff_delays[attempt])
+                    _backoff_sleep(attempt)
                     continue
                 return False, None, f"Network error: {e}"
         
         return False, None, "Max retries exceeded"
     
+    def _calbridge_post_batch(self, payloads: List[Dict[str, Any]]) -> Tuple[Optional[List[Dict]], Optional[str]]:
+        """
+        POST several events to CalBridge /add_batch in one request
+        
+        Args:
+            payloads: Request payloads, one per event
+            
+        Returns:
+            (results, error_message). results is the list of response dicts in
+            payload order. Both are None only when the server has no batch
+            endpoint (404/405), the one case safe to retry per event; after a
+            timeout or bad response the batch may already have been created.
+        """
+        try:
+            response = self.session.post(
+                f"{self.calbridge_base_url}/add_batch",
+                json={"events": payloads},
+                timeout=CALBRIDGE_TIMEOUT
+            )
+        except requests.RequestException as e:
+            return None, f"Network error during batch create: {e}"
+        
+        if response.status_code in (404, 405):
+            return None, None
+        if response.status_code != 200:
+            return None, f"CalBridge error {response.status_code}: {response.text}"
+        try:
+            results = response.json()
+        except ValueError:
+            return None, f"CalBridge returned invalid JSON for batch create: {response.text[:200]}"
+        if not isinstance(results, list) or len(results) != len(payloads):
+            return None, "CalBridge batch response does not match the request"
+        return results, None
+    
     def _calbridge_delete_with_retry(self,
                                     event_id: str,
                                     max_retries: int = 3) -> Tuple[bool, bool, Optional[str]]:
@@ -172,14 +384,12 @@ class EventCreatorAgent:
             (success, was_404, error_message)
             was_404: True if event was already deleted (404)
         """
-        backoff_delays = [0.1, 0.5, 2.0]
-        
         for attempt in range(max_retries):
             try:
-                response = requests.post(
+                response = self.session.post(
                     f"{self.calbridge_base_url}/delete",
                     params={"event_id": event_id},
-                    timeout=10
+                    timeout=CALBRIDGE_TIMEOUT
                 )
                 
                 if response.status_code == 200:
@@ -198,13 +408,13 @@ class EventCreatorAgent:
                 else:
                     # 5xx errors - retry
                     if attempt < max_retries - 1:
-                        time.sleep(backoff_delays[attempt])
+                        _backoff_sleep(attempt)
                         continue
                     return False, False, f"CalBridge server error {response.status_code}: {response.text}"
                     
             except requests.RequestException as e:
                 if attempt < max_retries - 1:
-                    time.sleep(backoff_delays[attempt])
+                    _backoff_sleep(attempt)
                     continue
                 return False, False, f"Network error: {e}"
         
@@ -327,27 +537,21 @@ class EventCreatorAgent:
         
         # Upsert to database
         conn = self._get_db_connection()
-        cursor = conn.cursor()
         
         try:
+            # Take the write lock up front so both upserts share one transaction
+            conn.execute("BEGIN IMMEDIATE")
+            
             # Upsert task
-            cursor.execute("""
-                INSERT OR REPLACE INTO tasks (id, title, parent_id)
-                VALUES (?, ?, ?)
-            """, (task_id, title, None))
+            conn.execute(_UPSERT_TASK_SQL, (task_id, title, None))
             
             # Upsert event_map
-            cursor.execute("""
-                INSERT OR REPLACE INTO event_map (task_id, calendar_id, calendar_event_id)
-                VALUES (?, ?, ?)
-            """, (task_id, calendar_id, calendar_event_id))
+            conn.execute(_UPSERT_EVENT_MAP_SQL, (task_id, calendar_id, calendar_event_id))
             
             conn.commit()
         except sqlite3.Error as e:
             conn.rollback()
             return CreateResult(success=False, task_id=task_id, error=f"Database error: {e}")
-        finally:
-            conn.close()
         
         return CreateResult(success=True, task_id=task_id, calendar_event_id=calendar_event_id)
     
@@ -379,23 +583,34 @@ class EventCreatorAgent:
         created = []
         failed = []
         
-        # Create events for each subtask
-        for subtask in subtasks:
-            subtask_id = subtask["id"]
-            subtask_title = subtask["title"]
-            slot = subtask["slot"]
-            
-            # Build CalBridge POST payload
-            payload = {
+        # Build CalBridge POST payloads
+        payloads = [
+            {
                 "calendar_id": calendar_id,
-                "title": subtask_title,
-                "start_iso": slot[0],
-                "end_iso": slot[1],
-                "notes": f"id:{subtask_id}, parent_id:{parent_id}"
+                "title": subtask["title"],
+                "start_iso": subtask["slot"][0],
+                "end_iso": subtask["slot"][1],
+                "notes": f"id:{subtask['id']}, parent_id:{parent_id}"
             }
-            
-            # POST to CalBridge with retry
-            success, response_data, error = self._calbridge_post_with_retry(payload)
+            for subtask in subtasks
+        ]
+        
+        # Try one batched POST; fall back to per-subtask POSTs only if the
+        # endpoint is missing, since any other failure may have created events
+        batch_results, batch_error = self._calbridge_post_batch(payloads)
+        if batch_results is not None:
+            post_results = [(True, response_data, None) for response_data in batch_results]
+        elif batch_error:
+            post_results = [(False, None, batch_error)] * len(payloads)
+        else:
+            # POST to CalBridge with retry, overlapping the round-trips
+            workers = max(1, min(MAX_PARALLEL_POSTS, len(payloads)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                post_results = list(pool.map(self._calbridge_post_with_retry, payloads))
+        
+        # Collect the result for each subtask, in input order
+        for subtask, (success, response_data, error) in zip(subtasks, post_results):
+            subtask_id = subtask["id"]
             
             if success and response_data:
                 calendar_event_id = response_data.get("id")
@@ -417,34 +632,24 @@ class EventCreatorAgent:
         
         # Upsert to database (even if some subtasks failed)
         conn = self._get_db_connection()
-        cursor = conn.cursor()
         
         try:
-            # Upsert parent task (no event, just metadata)
-            cursor.execute("""
-                INSERT OR REPLACE INTO tasks (id, title, parent_id)
-                VALUES (?, ?, ?)
-            """, (parent_id, parent_title, None))
-            
-            # Upsert subtask tasks and event_map for successful creates
-            for item in created:
-                subtask_id = item["task_id"]
-                calendar_event_id = item["calendar_event_id"]
-                
-                # Find subtask title
-                subtask_title = next((st["title"] for st in subtasks if st["id"] == subtask_id), "")
-                
-                # Upsert subtask task
-                cursor.execute("""
-                    INSERT OR REPLACE INTO tasks (id, title, parent_id)
-                    VALUES (?, ?, ?)
-                """, (subtask_id, subtask_title, parent_id))
-                
-                # Upsert event_map
-                cursor.execute("""
-                    INSERT OR REPLACE INTO event_map (task_id, calendar_id, calendar_event_id)
-                    VALUES (?, ?, ?)
-                """, (subtask_id, calendar_id, calendar_event_id))
+            # Take the write lock up front so all upserts share one transaction;
+            # foreign keys are checked once at COMMIT rather than per statement,
+            # so the batched tasks/event_map writes need no particular order
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("PRAGMA defer_foreign_keys = ON")
+            
+            # Upsert the parent task (no event, just metadata) and the
+            # successful subtasks together, then their event_map rows
+            titles = {st["id"]: st["title"] for st in subtasks}
+            task_rows = [(parent_id, parent_title, None)]
+            task_rows.extend((item["task_id"], titles.get(item["task_id"], ""), parent_id)
+                             for item in created)
+            conn.executemany(_UPSERT_TASK_SQL, task_rows)
+            conn.executemany(_UPSERT_EVENT_MAP_SQL,
+                             [(item["task_id"], calendar_id, item["calendar_event_id"])
+                              for item in created])
             
             conn.commit()
         except sqlite3.Error as e:
@@ -455,8 +660,6 @@ class EventCreatorAgent:
                 "created": created,
                 "failed": failed
             }
-        finally:
-            conn.close()
         
         return {
             "success": len(failed) == 0,
@@ -477,31 +680,36 @@ class EventCreatorAgent:
         result = DeleteResult(target="id")
         
         conn = self._get_db_connection()
-        cursor = conn.cursor()
         
-        # Check if task exists
-        cursor.execute("SELECT id, title, parent_id FROM tasks WHERE id = ?", (task_id,))
-        task_row = cursor.fetchone()
+        # Fetch the task and its children in one round-trip
+        cur = conn.execute("""
+            SELECT 
+                t.id,
+                (SELECT json_group_array(c.id) FROM tasks c WHERE c.parent_id = t.id) as children_json
+            FROM tasks t
+            WHERE t.id = ?
+        """, (task_id,))
+        task_row = cur.fetchone()
         
         if not task_row:
             result.skipped.append({
                 "task_id": task_id,
                 "reason": "not_found"
             })
-            conn.close()
             return result
         
-        # Check if this is a parent (has children)
-        cursor.execute("SELECT id FROM tasks WHERE parent_id = ?", (task_id,))
-        children = cursor.fetchall()
+        children = _json_loads(task_row[1])
+        
+        # Rows to drop once all calendar deletes are done
+        removed_ids = []
         
         if children:
             # This is a parent - delete all children first
-            for child_row in children:
-                child_id = child_row[0]
-                child_result = self._delete_child_task(cursor, child_id)
+            for child_id in children:
+                child_result = self._delete_child_task(conn, child_id)
                 
                 if child_result["success"]:
+                    removed_ids.append(child_id)
                     result.deleted.append({
                         "task_id": child_id,
                         "calendar_event_id": child_result.get("calendar_event_id", "")
@@ -518,12 +726,13 @@ class EventCreatorAgent:
                     })
             
             # Delete parent task row (no event_map for parent)
-            cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            removed_ids.append(task_id)
         else:
             # This is a child - delete normally
-            child_result = self._delete_child_task(cursor, task_id)
+            child_result = self._delete_child_task(conn, task_id)
             
             if child_result["success"]:
+                removed_ids.append(task_id)
                 result.deleted.append({
                     "task_id": task_id,
                     "calendar_event_id": child_result.get("calendar_event_id", "")
@@ -539,8 +748,7 @@ class EventCreatorAgent:
                     "reason": child_result.get("error", "Unknown error")
                 })
         
-        conn.commit()
-        conn.close()
+        self._delete_task_rows(conn, removed_ids)
         
         return result
     
@@ -557,18 +765,19 @@ class EventCreatorAgent:
         result = DeleteResult(target="parent_id")
         
         conn = self._get_db_connection()
-        cursor = conn.cursor()
         
         # Get all children
-        cursor.execute("SELECT id FROM tasks WHERE parent_id = ?", (parent_id,))
-        children = cursor.fetchall()
+        cur = conn.execute("SELECT id FROM tasks WHERE parent_id = ?", (parent_id,))
+        children = cur.fetchall()
         
-        # Delete each child
+        # Delete each child's calendar event; rows are dropped afterwards
+        removed_ids = []
         for child_row in children:
             child_id = child_row[0]
-            child_result = self._delete_child_task(cursor, child_id)
+            child_result = self._delete_child_task(conn, child_id)
             
             if child_result["success"]:
+                removed_ids.append(child_id)
                 result.deleted.append({
                     "task_id": child_id,
                     "calendar_event_id": child_result.get("calendar_event_id", "")
@@ -584,48 +793,41 @@ class EventCreatorAgent:
                     "reason": child_result.get("error", "Unknown error")
                 })
         
-        # Delete parent task row
-        cursor.execute("DELETE FROM tasks WHERE id = ?", (parent_id,))
-        
-        conn.commit()
-        conn.close()
+        # Delete children and the parent task row
+        removed_ids.append(parent_id)
+        self._delete_task_rows(conn, removed_ids)
         
         return result
     
-    def _delete_child_task(self, cursor: sqlite3.Cursor, task_id: str) -> Dict[str, Any]:
+    def _delete_child_task(self, conn: sqlite3.Connection, task_id: str) -> Dict[str, Any]:
         """
-        Delete a child task (has event_map entry)
+        Delete a child task's calendar event (has event_map entry)
+        
+        Database rows are left in place; callers collect the successful IDs
+        and remove them in one batch with _delete_task_rows.
         
         Args:
-            cursor: Database cursor
+            conn: Database connection
             task_id: Task ID to delete
             
         Returns:
             Dict with success, was_404, calendar_event_id, error
         """
         # Get event_map entry
-        cursor.execute("""
-            SELECT calendar_id, calendar_event_id 
-            FROM event_map 
-            WHERE task_id = ?
-        """, (task_id,))
+        cur = conn.execute("SELECT calendar_event_id FROM event_map WHERE task_id = ?", (task_id,))
         
-        event_map_row = cursor.fetchone()
+        event_map_row = cur.fetchone()
         
         if not event_map_row:
-            # No event_map - just delete task row
-            cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            # No event_map - only the task row needs deleting
             return {"success": True, "was_404": False}
         
-        calendar_id, calendar_event_id = event_map_row
+        calendar_event_id = event_map_row[0]
         
         # Delete from CalBridge
         success, was_404, error = self._calbridge_delete_with_retry(calendar_event_id)
         
         if success:
-            # Delete from event_map and tasks
-            cursor.execute("DELETE FROM event_map WHERE task_id = ?", (task_id,))
-            cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
             return {
                 "success": True,
                 "was_404": was_404,
@@ -638,6 +840,27 @@ class EventCreatorAgent:
                 "error": error
             }
     
+    def _delete_task_rows(self, conn: sqlite3.Connection, task_ids: List[str]):
+        """
+        Delete tasks with one batched statement; their event_map rows follow
+        through ON DELETE CASCADE
+        
+        Runs in its own write transaction, after all CalBridge calls are done,
+        so the write lock is never held across network I/O.
+        
+        Args:
+            conn: Database connection
+            task_ids: Task IDs whose rows should be removed
+        """
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("DELETE FROM tasks WHERE id = ?",
+                             [(task_id,) for task_id in task_ids])
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+    
     def list_events(self) -> List[Dict[str, Any]]:
         """
         List all events in the database
@@ -645,53 +868,51 @@ class EventCreatorAgent:
         Returns:
             List of dictionaries with task information
         """
-        conn = self._get_db_connection()
-        cursor = conn.cursor()
+        conn = self._get_db_connection(read_only=True)
         
         try:
-            # Get all tasks with their event mappings
+            # Get all tasks with their event mappings and child counts
             # SQLite doesn't support NULLS LAST, so we use CASE to order NULLs last
-            cursor.execute("""
+            cur = conn.execute("""
                 SELECT 
                     t.id,
                     t.title,
                     t.parent_id,
                     em.calendar_id,
                     em.calendar_event_id,
-                    (SELECT COUNT(*) FROM tasks WHERE parent_id = t.id) as child_count
+                    COALESCE(cc.child_count, 0) as child_count
                 FROM tasks t
                 LEFT JOIN event_map em ON t.id = em.task_id
+                -- Count children once per parent instead of a subquery per row
+                LEFT JOIN (
+                    SELECT parent_id, COUNT(*) as child_count
+                    FROM tasks
+                    WHERE parent_id IS NOT NULL
+                    GROUP BY parent_id
+                ) cc ON cc.parent_id = t.id
                 ORDER BY CASE WHEN t.parent_id IS NULL THEN 0 ELSE 1 END, t.id
             """)
             
-            rows = cursor.fetchall()
-            events = []
-            
-            for row in rows:
-                task_id, title, parent_id, calendar_id, calendar_event_id, child_count = row
-                
-                # Determine task type
-                task_type = "parent" if child_count > 0 else ("subtask" if parent_id else "simple")
-                
-                event_info = {
+            # Build the dicts straight off the cursor; no intermediate row list
+            events = [
+                {
                     "task_id": task_id,
                     "title": title,
-                    "type": task_type,
+                    "type": "parent" if child_count > 0 else ("subtask" if parent_id else "simple"),
                     "parent_id": parent_id,
                     "calendar_id": calendar_id,
                     "calendar_event_id": calendar_event_id,
                     "has_event": calendar_event_id is not None,
                     "child_count": child_count
                 }
-                events.append(event_info)
+                for task_id, title, parent_id, calendar_id, calendar_event_id, child_count in cur
+            ]
             
             return events
             
         except sqlite3.Error as e:
             print(f"Error listing events: {e}")
             return []
-        finally:
-            conn.close()
     
     def delete_all_events(self) -> DeleteResult:
         """
@@ -703,23 +924,21 @@ class EventCreatorAgent:
         result = DeleteResult(target="all")
         
         conn = self._get_db_connection()
-        cursor = conn.cursor()
         
         try:
             # Get all tasks with their event mappings (only tasks that have calendar events)
-            cursor.execute("""
+            cur = conn.execute("""
                 SELECT 
                     t.id,
-                    t.title,
                     em.calendar_event_id
                 FROM tasks t
                 INNER JOIN event_map em ON t.id = em.task_id
             """)
             
-            tasks_with_events = cursor.fetchall()
+            tasks_with_events = cur.fetchall()
             
             # Delete each calendar event
-            for task_id, title, calendar_event_id in tasks_with_events:
+            for task_id, calendar_event_id in tasks_with_events:
                 if calendar_event_id:
                     success, was_404, error = self._calbridge_delete_with_retry(calendar_event_id)
                     
@@ -739,13 +958,16 @@ class EventCreatorAgent:
                             "reason": error or "Unknown error"
                         })
             
+            # Calendar calls are done; take the write lock only for the deletes
+            conn.execute("BEGIN IMMEDIATE")
+            
             # Delete all entries from event_map table
-            cursor.execute("DELETE FROM event_map")
-            event_map_deleted = cursor.rowcount
+            cur = conn.execute("DELETE FROM event_map")
+            event_map_deleted = cur.rowcount
             
             # Delete all entries from tasks table
-            cursor.execute("DELETE FROM tasks")
-            tasks_deleted = cursor.rowcount
+            cur = conn.execute("DELETE FROM tasks")
+            tasks_deleted = cur.rowcount
             
             conn.commit()
             
@@ -758,27 +980,24 @@ class EventCreatorAgent:
                 "task_id": "all",
                 "reason": f"Database error: {e}"
             })
-        finally:
-            conn.close()
         
         return result
 
 
 # Example usage
 if __name__ == "__main__":
-    agent = EventCreatorAgent()
-    
-    # Test simple task
-    print("Testing simple task creation...")
-    ta_simple = {
-        "calendar": "test_cal",
-        "type": "simple",
-        "title": "Call mom",
-        "slot": ["2025-11-07T14:00:00-05:00", "2025-11-07T14:30:00-05:00"],
-        "id": "test-id-123",
-        "parent_id": None
-    }
-    
-    result = agent.create_simple_task(ta_simple)
-    print(f"Result: {result}")
+    with EventCreatorAgent() as agent:
+        # Test simple task
+        print("Testing simple task creation...")
+        ta_simple = {
+            "calendar": "test_cal",
+            "type": "simple",
+            "title": "Call mom",
+            "slot": ["2025-11-07T14:00:00-05:00", "2025-11-07T14:30:00-05:00"],
+            "id": "test-id-123",
+            "parent_id": None
+        }
+        
+        result = agent.create_simple_task(ta_simple)
+        print(f"Result: {result}")
 
@@ -1,11 +1,136 @@
 """
 LLM Decomposer Component - Decomposes complex tasks into subtasks
 """
+import atexit
+import hashlib
 import json
+import os
 import re
-from typing import Optional, Dict, Any, List
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from pydantic import BaseModel
-from llm_setup import get_llm_decomposer
+
+try:
+    import orjson
+except ImportError:  # optional speedup; not in agents/requirements.txt
+    orjson = None
+
+from config import OLLAMA_MODEL
+from llm_setup import get_llm_decomposer, invoke_json
+
+# Decompositions keyed by a hash of the rendered prompt, shared across
+# instances so repeat tasks in one process skip the LLM call; least
+# recently used first, so eviction pops from the front. Values are
+# (saved_at, subtasks); entries older than the TTL are treated as misses so
+# prompt or model tweaks that keep the same key still get fresh output
+_DECOMPOSITION_CACHE: "OrderedDict[str, Tuple[float, List[tuple]]]" = OrderedDict()
+_DECOMPOSITION_CACHE_MAX = 256
+_DECOMPOSITION_CACHE_TTL_S = 7 * 24 * 3600
+
+# Compiled once; these run on every LLM response
+_ISO8601_DURATION_RE = re.compile(r'^PT(\d+H)?(\d+M)?$')
+_HOURS_RE = re.compile(r'(\d+)H')
+_MINUTES_RE = re.compile(r'(\d+)M')
+_SUBTASKS_OBJECT_RE = re.compile(r'\{[^{}]*"subtasks"\s*:\s*\[[^\]]*\][^{}]*\}', re.DOTALL)
+# On-disk copy of the cache so decompositions survive process restarts; kept
+# under the repo's config/ next to the calendar cache, not in the source tree
+_DECOMPOSITION_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "decomposer_cache.json"
+)
+_disk_cache_loaded = False
+_atexit_registered = False
+# New entries are written out in batches of this many, and at exit
+_DISK_FLUSH_EVERY = 8
+_unsaved_entries = 0
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson else json.loads
+
+
+def _load_disk_cache() -> None:
+    """Seed the in-memory decomposition cache from disk (once per process)"""
+    global _disk_cache_loaded
+    if _disk_cache_loaded:
+        return
+    _disk_cache_loaded = True
+    try:
+        with open(_DECOMPOSITION_CACHE_PATH, "rb") as f:
+            data = _json_loads(f.read())
+    except (OSError, ValueError):
+        return
+    if not isinstance(data, dict):
+        return
+    cutoff = time.time() - _DECOMPOSITION_CACHE_TTL_S
+    for key, entry in list(data.items())[-_DECOMPOSITION_CACHE_MAX:]:
+        try:
+            saved_at, subtasks = entry
+            if saved_at < cutoff:
+                continue
+            _DECOMPOSITION_CACHE.setdefault(key, (saved_at, [tuple(st) for st in subtasks]))
+        except (TypeError, ValueError):
+            continue  # entry from an older cache format
+
+
+def _get_cached_decomposition(cache_key: str) -> Optional[List[tuple]]:
+    """Return a fresh cached decomposition and mark it recently used"""
+    entry = _DECOMPOSITION_CACHE.get(cache_key)
+    if entry is None:
+        return None
+    if time.time() - entry[0] >= _DECOMPOSITION_CACHE_TTL_S:
+        del _DECOMPOSITION_CACHE[cache_key]
+        return None
+    _DECOMPOSITION_CACHE.move_to_end(cache_key)
+    return entry[1]
+
+
+def _save_disk_cache() -> None:
+    """Write unsaved decompositions to disk atomically; failures are ignored"""
+    global _unsaved_entries
+    if not _unsaved_entries:
+        return
+    _unsaved_entries = 0
+    if orjson:
+        # orjson walks an OrderedDict in insertion order, ignoring
+        # move_to_end; a plain dict copy keeps the LRU order on disk
+        data = orjson.dumps(dict(_DECOMPOSITION_CACHE))
+    else:
+        data = json.dumps(_DECOMPOSITION_CACHE).encode("utf-8")
+    try:
+        os.makedirs(os.path.dirname(_DECOMPOSITION_CACHE_PATH), exist_ok=True)
+        # A unique temp file per write, so concurrent processes never
+        # interleave into one before the rename
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(_DECOMPOSITION_CACHE_PATH), suffix=".tmp"
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, _DECOMPOSITION_CACHE_PATH)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _remember_decomposition(cache_key: str, subtasks: List[tuple]) -> None:
+    """Insert into the LRU cache, evicting the stalest entry when full"""
+    global _unsaved_entries, _atexit_registered
+    _DECOMPOSITION_CACHE[cache_key] = (time.time(), subtasks)
+    _DECOMPOSITION_CACHE.move_to_end(cache_key)
+    while len(_DECOMPOSITION_CACHE) > _DECOMPOSITION_CACHE_MAX:
+        _DECOMPOSITION_CACHE.popitem(last=False)
+    _unsaved_entries += 1
+    if not _atexit_registered:
+        # Only processes that actually decompose write the cache at exit
+        atexit.register(_save_disk_cache)
+        _atexit_registered = True
+    if _unsaved_entries >= _DISK_FLUSH_EVERY:
+        _save_disk_cache()
 
 
 class Subtask(BaseModel):
@@ -47,7 +172,11 @@ class LLMDecomposer:
     
     def __init__(self):
         self.llm = get_llm_decomposer()
-        self.prompt_template = self._create_prompt_template()
+        _load_disk_cache()
+        # The instruction block is rendered once and sent byte-identical on
+        # every call so Ollama can reuse its KV cache; only the task block varies
+        self.prompt_prefix = self._create_prompt_prefix()
+        self.task_template = self._create_task_template()
     
     def _validate_iso8601_duration(self, duration: str) -> bool:
         """
@@ -61,8 +190,7 @@ class LLMDecomposer:
         """
         # Pattern: PT followed by optional hours (H) and/or minutes (M)
         # Examples: PT30M, PT1H, PT2H30M, PT3H
-        pattern = r'^PT(\d+H)?(\d+M)?$'
-        match = re.match(pattern, duration.upper())
+        match = _ISO8601_DURATION_RE.match(duration.upper())
         if not match:
             return False
         
@@ -104,11 +232,11 @@ class LLMDecomposer:
         hours = 0
         minutes = 0
         
-        hours_match = re.search(r'(\d+)H', duration)
+        hours_match = _HOURS_RE.search(duration)
         if hours_match:
             hours = int(hours_match.group(1))
         
-        minutes_match = re.search(r'(\d+)M', duration)
+        minutes_match = _MINUTES_RE.search(duration)
         if minutes_match:
             minutes = int(minutes_match.group(1))
         
@@ -183,8 +311,8 @@ class LLMDecomposer:
         
         return validated
     
-    def _create_prompt_template(self) -> str:
-        """Create the prompt template for task decomposition"""
+    def _create_prompt_prefix(self) -> str:
+        """Create the static instruction block shared by every decomposition"""
         return """
 You are an LLM Decomposer that breaks down complex tasks into clear, schedulable subtasks.
 
@@ -237,56 +365,60 @@ Choose 2-5 phases that fit:
 
 ## Output Format (STRICT JSON):
 ```json
-{{
+{
   "subtasks": [
-    {{"title": "...", "duration": "PT..."}},
+    {"title": "...", "duration": "PT..."},
     ...
   ]
-}}
+}
 ```
 
 ## Examples:
 
 1. **Work — "Draft project proposal"**
 ```json
-{{
+{
   "subtasks": [
-    {{"title":"Research background and inputs (project proposal)","duration":"PT1H30M"}},
-    {{"title":"Create proposal outline (project proposal)","duration":"PT45M"}},
-    {{"title":"Write key sections (project proposal)","duration":"PT2H"}},
-    {{"title":"Self-review and revise (project proposal)","duration":"PT1H"}},
-    {{"title":"Export and share proposal (project proposal)","duration":"PT30M"}}
+    {"title":"Research background and inputs (project proposal)","duration":"PT1H30M"},
+    {"title":"Create proposal outline (project proposal)","duration":"PT45M"},
+    {"title":"Write key sections (project proposal)","duration":"PT2H"},
+    {"title":"Self-review and revise (project proposal)","duration":"PT1H"},
+    {"title":"Export and share proposal (project proposal)","duration":"PT30M"}
   ]
-}}
+}
 ```
 
 2. **Home — "Plan 5-day Japan trip"**
 ```json
-{{
+{
   "subtasks": [
-    {{"title":"List must-see cities and dates (Japan trip)","duration":"PT1H"}},
-    {{"title":"Compare flights and book (Japan trip)","duration":"PT2H"}},
-    {{"title":"Draft day-by-day itinerary (Japan trip)","duration":"PT1H30M"}},
-    {{"title":"Book lodging and passes (Japan trip)","duration":"PT2H"}},
-    {{"title":"Finalize budget and checklist (Japan trip)","duration":"PT45M"}}
+    {"title":"List must-see cities and dates (Japan trip)","duration":"PT1H"},
+    {"title":"Compare flights and book (Japan trip)","duration":"PT2H"},
+    {"title":"Draft day-by-day itinerary (Japan trip)","duration":"PT1H30M"},
+    {"title":"Book lodging and passes (Japan trip)","duration":"PT2H"},
+    {"title":"Finalize budget and checklist (Japan trip)","duration":"PT45M"}
   ]
-}}
+}
 ```
 
 3. **Work — "Prepare onboarding plan"**
 ```json
-{{
+{
   "subtasks": [
-    {{"title":"Gather role requirements (onboarding plan)","duration":"PT1H"}},
-    {{"title":"Draft 30-60-90 plan (onboarding plan)","duration":"PT1H30M"}},
-    {{"title":"Create learning resources list (onboarding plan)","duration":"PT1H"}},
-    {{"title":"Review and refine with notes (onboarding plan)","duration":"PT1H"}},
-    {{"title":"Package and share plan (onboarding plan)","duration":"PT30M"}}
+    {"title":"Gather role requirements (onboarding plan)","duration":"PT1H"},
+    {"title":"Draft 30-60-90 plan (onboarding plan)","duration":"PT1H30M"},
+    {"title":"Create learning resources list (onboarding plan)","duration":"PT1H"},
+    {"title":"Review and refine with notes (onboarding plan)","duration":"PT1H"},
+    {"title":"Package and share plan (onboarding plan)","duration":"PT30M"}
   ]
-}}
+}
 ```
 
-## Task to Decompose:
+"""
+    
+    def _create_task_template(self) -> str:
+        """Create the per-task block appended after the static prefix"""
+        return """## Task to Decompose:
 Title: "{title}"
 Type: {type}
 Calendar: {calendar}
@@ -327,15 +459,35 @@ Decompose this complex task into 2-5 subtasks with ISO-8601 durations (max PT3H
         calendar = td_output.get("calendar")
         
         # Format the prompt
-        prompt = self.prompt_template.format(
+        prompt = self.prompt_prefix + self.task_template.format(
             title=title,
             type=task_type,
             calendar=calendar or "N/A"
         )
         
+        # Key on the prompt as it would read with no calendar: the subtasks
+        # depend only on the title (calendar is passed through untouched),
+        # so the same task filed under another calendar, or with stray
+        # whitespace in its title, reuses the cached decomposition
+        # The model name is part of the key, so switching models misses
+        key_prompt = OLLAMA_MODEL + "\n" + self.prompt_prefix + self.task_template.format(
+            title=" ".join(title.split()),
+            type=task_type,
+            calendar=""
+        )
+        cache_key = hashlib.blake2b(key_prompt.encode("utf-8"), digest_size=16).hexdigest()
+        cached = _get_cached_decomposition(cache_key)
+        if cached is not None:
+            return TaskDecomposition(
+                calendar=calendar,
+                type=task_type,
+                title=title,
+                subtasks=[Subtask(title=t, duration=d) for t, d in cached]
+            )
+        
         try:
-            # Get LLM response
-            response = self.llm.invoke(prompt)
+            # Get LLM response (stream stops once the JSON object closes)
+            response = invoke_json(self.llm, prompt)
             
             # Parse JSON response
             response_text = response.strip()
@@ -352,28 +504,16 @@ Decompose this complex task into 2-5 subtasks with ISO-8601 durations (max PT3H
             
             # Parse JSON
             try:
-                decomposition_data = json.loads(response_text)
-            except json.JSONDecodeError as e:
+                decomposition_data = _json_loads(response_text)
+            except json.JSONDecodeError:
                 # If JSON parsing fails, try to extract JSON from the response
                 # More robust pattern that handles nested structures
-                json_match = re.search(r'\{[^{}]*"subtasks"\s*:\s*\[[^\]]*\][^{}]*\}', response_text, re.DOTALL)
-                if json_match:
-                    try:
-                        decomposition_data = json.loads(json_match.group())
-                    except json.JSONDecodeError:
-                        # Try a simpler extraction
-                        import json as json_module
-                        # Find the subtasks array
-                        subtasks_match = re.search(r'"subtasks"\s*:\s*\[(.*?)\]', response_text, re.DOTALL)
-                        if subtasks_match:
-                            # Try to reconstruct JSON
-                            subtasks_str = subtasks_match.group(1)
-                            decomposition_data = {"subtasks": []}
-                            # This is a fallback - in practice, we should fix the LLM output
-                            raise ValueError(f"Could not parse JSON from response: {response_text}")
-                        else:
-                            raise ValueError(f"Could not parse JSON from response: {response_text}")
-                else:
+                json_match = _SUBTASKS_OBJECT_RE.search(response_text)
+                if not json_match:
+                    raise ValueError(f"Could not parse JSON from response: {response_text}")
+                try:
+                    decomposition_data = _json_loads(json_match.group())
+                except json.JSONDecodeError:
                     raise ValueError(f"Could not parse JSON from response: {response_text}")
             
             # Extract subtasks
@@ -384,6 +524,8 @@ Decompose this complex task into 2-5 subtasks with ISO-8601 durations (max PT3H
             # Validate and fix subtasks
             validated_subtasks = self._validate_and_fix_subtasks(subtasks_raw)
             
+            _remember_decomposition(cache_key, [(st.title, st.duration) for st in validated_subtasks])
+            
             # Create final decomposition
             return TaskDecomposition(
                 calendar=calendar,
@@ -2,9 +2,16 @@
 LLM Setup for Streamlined Agents
 Using Ollama with llama3
 """
+from functools import lru_cache
+
 from langchain_ollama import OllamaLLM
 from config import OLLAMA_BASE_URL, OLLAMA_MODEL
 
+# The factories below are memoized: each OllamaLLM owns an HTTP client, so
+# agents built per request share one keep-alive connection pool per config
+# instead of opening a new one every time. Callers must not mutate them.
+
+@lru_cache(maxsize=None)
 def get_llm():
     """Get configured Ollama LLM instance"""
     return OllamaLLM(
@@ -15,6 +22,7 @@ def get_llm():
         num_predict=1024
     )
 
+@lru_cache(maxsize=None)
 def get_llm_low_temp():
     """Get configured Ollama LLM instance with low temperature (for Task Difficulty Analyzer)"""
     return OllamaLLM(
@@ -25,6 +33,7 @@ def get_llm_low_temp():
         num_predict=256  # Shorter responses for JSON-only output
     )
 
+@lru_cache(maxsize=None)
 def get_llm_decomposer():
     """Get configured Ollama LLM instance for LLM Decomposer (temp 0.3, compact output)"""
     return OllamaLLM(
@@ -35,6 +44,41 @@ def get_llm_decomposer():
         num_predict=384  # Compact JSON output for subtasks
     )
 
+def invoke_json(llm, prompt: str) -> str:
+    """
+    Stream a completion and stop once the first top-level JSON object closes.
+    
+    Agents ask for JSON only, so anything generated after the closing brace
+    is waste; closing the stream early also stops Ollama generating it.
+    Returns the full text if no complete object is seen.
+    """
+    parts = []
+    depth, in_str, esc, started = 0, False, False, False
+    stream = llm.stream(prompt)
+    try:
+        for delta in stream:
+            parts.append(delta)
+            for ch in delta:
+                if in_str:
+                    if esc:
+                        esc = False
+                    elif ch == "\\":
+                        esc = True
+                    elif ch == '"':
+                        in_str = False
+                elif ch == '"' and started:
+                    in_str = True
+                elif ch == "{":
+                    depth += 1
+                    started = True
+                elif ch == "}" and started:
+                    depth -= 1
+                    if depth == 0:
+                        return "".join(parts)
+    finally:
+        stream.close()
+    return "".join(parts)
+
 def test_llm():
     """Test the LLM connection"""
     try:
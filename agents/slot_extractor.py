@@ -2,10 +2,22 @@
 Slot Extractor Component - LLM-based extraction of start, end, duration from user queries
 """
 import json
+import re
 from typing import Optional, Dict, Any
 from pydantic import BaseModel
 from llm_setup import get_llm
 
+try:
+    import orjson
+except ImportError:  # optional speedup; not in agents/requirements.txt
+    orjson = None
+
+# Pulls the slots object out of a reply that has prose around it
+_JSON_OBJECT_RE = re.compile(r'\{[^}]*\}')
+
+# Decoder for the slots reply; orjson's JSONDecodeError subclasses json's
+_json_loads = orjson.loads if orjson else json.loads
+
 
 class SlotExtraction(BaseModel):
     """Slot extraction result model"""
@@ -190,13 +202,12 @@ Extract the slots and return JSON:
             
             # Parse JSON
             try:
-                slots_data = json.loads(response_text)
-            except json.JSONDecodeError as e:
+                slots_data = _json_loads(response_text)
+            except json.JSONDecodeError:
                 # If JSON parsing fails, try to extract JSON from the response
-                import re
-                json_match = re.search(r'\{[^}]*\}', response_text)
+                json_match = _JSON_OBJECT_RE.search(response_text)
                 if json_match:
-                    slots_data = json.loads(json_match.group())
+                    slots_data = _json_loads(json_match.group())
                 else:
                     raise ValueError(f"Could not parse JSON from response: {response_text}")
             
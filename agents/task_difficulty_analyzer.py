@@ -2,11 +2,52 @@
 Task Difficulty Analyzer Component - LLM-based classification of tasks and calendar assignment
 """
 import json
+import re
+import time
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, List, Tuple
 from pydantic import BaseModel
 from llm_setup import get_llm_low_temp
 
+try:
+    import orjson
+except ImportError:  # optional speedup; not in agents/requirements.txt
+    orjson = None
+
+# Pulls the classification object out of a reply that has prose around it
+_JSON_OBJECT_RE = re.compile(r'\{[^}]*\}')
+
+# Decoder for the classification reply
+_json_loads = orjson.loads if orjson else json.loads
+
+# Keyword hints used to repair an invalid calendar ID from the LLM, matched as
+# substrings of the lowercased query. Each list is compiled once into a single
+# alternation: it matches exactly when some keyword occurs in the query, so
+# one scan gives the same answer as testing every keyword in turn
+_WORK_KEYWORDS = (
+    'client', 'manager', 'team', 'meeting', 'deck', 'proposal', 'report', 'prd',
+    'sprint', 'code', 'repo', 'deploy', 'invoice', 'expense', 'contract', 'nda',
+    'design', 'marketing', 'sales', 'finance', 'legal', 'roadmap', 'okr',
+)
+_HOME_KEYWORDS = (
+    'mom', 'dad', 'family', 'friend', 'groceries', 'laundry', 'gym', 'workout',
+    'dentist', 'doctor', 'birthday', 'rent', 'clean', 'apartment', 'house',
+)
+_WORK_KEYWORDS_RE = re.compile('|'.join(map(re.escape, _WORK_KEYWORDS)))
+_HOME_KEYWORDS_RE = re.compile('|'.join(map(re.escape, _HOME_KEYWORDS)))
+
+# Instruction block rendered per (work_id, home_id). The pipeline builds a
+# fresh analyzer per query, so this lives at module level to be reused
+# byte-identical across instances until the calendars change.
+_PROMPT_PREFIXES: Dict[Tuple[str, str], str] = {}
+
+# Work/Home calendar IDs per CalBridge URL, with the time.monotonic() at
+# which they go stale. Shared for the same reason, so back-to-back queries
+# do not each refetch /calendars; the TTL picks up renamed calendars.
+_WORK_HOME_TTL = 60.0
+_WORK_HOME_CACHE: Dict[str, Tuple[float, Dict[str, Optional[str]]]] = {}
+
 
 class TaskDifficultyAnalysis(BaseModel):
     """Task difficulty analysis result model"""
@@ -34,7 +75,13 @@ class TaskDifficultyAnalyzer:
     def __init__(self, calbridge_base_url: str = "http://127.0.0.1:8765"):
         self.llm = get_llm_low_temp()  # Low temperature for deterministic JSON output
         self.calbridge_base_url = calbridge_base_url
+        # Keep-alive session so repeated /calendars fetches reuse one connection
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        # Work/Home calendar IDs, resolved on first use and reused across analyze() calls
+        self._work_home_ids: Optional[Dict[str, Optional[str]]] = None
         self.prompt_template = self._create_prompt_template()
+        self.query_template = self._create_query_template()
     
     def _fetch_calendars(self) -> List[Dict[str, Any]]:
         """
@@ -44,7 +91,7 @@ class TaskDifficultyAnalyzer:
             List of calendar dictionaries with id, title, allows_modifications
         """
         try:
-            response = requests.get(f"{self.calbridge_base_url}/calendars", timeout=10)
+            response = self.session.get(f"{self.calbridge_base_url}/calendars", timeout=10)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -64,36 +111,69 @@ class TaskDifficultyAnalyzer:
         work_id = None
         home_id = None
         
+        # Writable calendars as (title, id), sorted so the choice -- and the
+        # prompt built from it -- does not depend on the API's listing order
+        writable = sorted(
+            (
+                ((cal.get('title', '') or '').strip().lower(), cal.get('id'))
+                for cal in calendars
+                if cal.get('allows_modifications', False)
+            ),
+            key=lambda tc: (tc[0], str(tc[1]))
+        )
+        
         # First pass: look for exact matches (case-insensitive)
-        for cal in calendars:
-            title = (cal.get('title', '') or '').strip().lower()
-            is_writable = cal.get('allows_modifications', False)
-            
-            if not is_writable:
-                continue
-            
+        for title, cal_id in writable:
             if title == 'work' and work_id is None:
-                work_id = cal.get('id')
+                work_id = cal_id
             elif title == 'home' and home_id is None:
-                home_id = cal.get('id')
+                home_id = cal_id
         
         # Second pass: look for partial matches (if exact not found)
-        for cal in calendars:
-            title = (cal.get('title', '') or '').strip().lower()
-            is_writable = cal.get('allows_modifications', False)
-            
-            if not is_writable:
-                continue
-            
+        for title, cal_id in writable:
             if work_id is None and 'work' in title:
-                work_id = cal.get('id')
+                work_id = cal_id
             elif home_id is None and 'home' in title:
-                home_id = cal.get('id')
+                home_id = cal_id
         
         return {'work_id': work_id, 'home_id': home_id}
     
+    def _get_work_home_calendars(self) -> Dict[str, Optional[str]]:
+        """
+        Resolve Work and Home calendar IDs, fetching from CalBridge only once
+        
+        A fresh result from another analyzer on the same CalBridge URL is
+        reused. A failed fetch is not cached, so the next call retries.
+        
+        Returns:
+            Dictionary with 'work_id' and 'home_id' keys
+        """
+        if self._work_home_ids is not None:
+            return self._work_home_ids
+        cached = _WORK_HOME_CACHE.get(self.calbridge_base_url)
+        if cached is not None and time.monotonic() < cached[0]:
+            self._work_home_ids = cached[1]
+            return self._work_home_ids
+        calendars = self._fetch_calendars()
+        work_home_ids = self._find_work_home_calendars(calendars)
+        if calendars:
+            self._work_home_ids = work_home_ids
+            _WORK_HOME_CACHE[self.calbridge_base_url] = (
+                time.monotonic() + _WORK_HOME_TTL, work_home_ids
+            )
+        return work_home_ids
+    
+    def prefetch(self) -> None:
+        """
+        Resolve the Work/Home calendar IDs ahead of analyze()
+        
+        Meant to run on a worker thread while earlier pipeline stages are
+        busy; analyze() then reuses the IDs instead of waiting on CalBridge.
+        """
+        self._get_work_home_calendars()
+    
     def _create_prompt_template(self) -> str:
-        """Create the prompt template for task difficulty analysis"""
+        """Create the calendar-bound instruction block (formatted with work_id/home_id)"""
         return """
 You are a Task Difficulty Analyzer that classifies tasks and assigns calendars.
 
@@ -190,7 +270,11 @@ mom, dad, family, friend, groceries, laundry, gym, workout, dentist, doctor, bir
    Output: {{"calendar":"{work_id}","type":"complex","title":"Prepare onboarding plan","duration":null}}
 
 ## Current Context:
-User Query: "{query}"
+"""
+    
+    def _create_query_template(self) -> str:
+        """Create the per-query block appended after the instruction block"""
+        return """User Query: "{query}"
 Duration: {duration}
 Available Calendars:
 - Work: {work_id}
@@ -213,9 +297,8 @@ Analyze the task and return JSON:
         if not query or not query.strip():
             raise ValueError("Query cannot be empty")
         
-        # Fetch calendars from CalBridge
-        calendars = self._fetch_calendars()
-        work_home_ids = self._find_work_home_calendars(calendars)
+        # Fetch calendars from CalBridge (cached after the first success)
+        work_home_ids = self._get_work_home_calendars()
         
         work_id = work_home_ids.get('work_id')
         home_id = work_home_ids.get('home_id')
@@ -227,8 +310,12 @@ Analyze the task and return JSON:
         # Format duration for prompt (use "null" string if None)
         duration_str = str(duration) if duration is not None else "null"
         
-        # Format the prompt
-        prompt = self.prompt_template.format(
+        # Format the prompt: cached instruction block + per-query block
+        prefix = _PROMPT_PREFIXES.get((work_id_str, home_id_str))
+        if prefix is None:
+            prefix = self.prompt_template.format(work_id=work_id_str, home_id=home_id_str)
+            _PROMPT_PREFIXES[(work_id_str, home_id_str)] = prefix
+        prompt = prefix + self.query_template.format(
             query=query.strip(),
             duration=duration_str,
             work_id=work_id_str,
@@ -254,27 +341,23 @@ Analyze the task and return JSON:
             
             # Parse JSON
             try:
-                analysis_data = json.loads(response_text)
-            except json.JSONDecodeError as e:
+                analysis_data = _json_loads(response_text)
+            except json.JSONDecodeError:
                 # If JSON parsing fails, try to extract JSON from the response
-                import re
-                json_match = re.search(r'\{[^}]*\}', response_text)
+                json_match = _JSON_OBJECT_RE.search(response_text)
                 if json_match:
-                    analysis_data = json.loads(json_match.group())
+                    analysis_data = _json_loads(json_match.group())
                 else:
                     raise ValueError(f"Could not parse JSON from response: {response_text}")
             
             # Validate calendar ID
             calendar_id = analysis_data.get("calendar")
-            if calendar_id and calendar_id not in [work_id, home_id]:
+            if calendar_id and calendar_id not in (work_id, home_id):
                 # If LLM returned an invalid calendar ID, try to fix it
                 # Check if it's a work or home task based on keywords
                 query_lower = query.lower()
-                work_keywords = ['client', 'manager', 'team', 'meeting', 'deck', 'proposal', 'report', 'prd', 'sprint', 'code', 'repo', 'deploy', 'invoice', 'expense', 'contract', 'nda', 'design', 'marketing', 'sales', 'finance', 'legal', 'roadmap', 'okr']
-                home_keywords = ['mom', 'dad', 'family', 'friend', 'groceries', 'laundry', 'gym', 'workout', 'dentist', 'doctor', 'birthday', 'rent', 'clean', 'apartment', 'house']
-                
-                has_work = any(kw in query_lower for kw in work_keywords)
-                has_home = any(kw in query_lower for kw in home_keywords)
+                has_work = _WORK_KEYWORDS_RE.search(query_lower) is not None
+                has_home = _HOME_KEYWORDS_RE.search(query_lower) is not None
                 
                 if has_work and work_id:
                     calendar_id = work_id
@@ -293,7 +376,7 @@ Analyze the task and return JSON:
                 task_type = "simple"  # Enforce: duration present → simple
             else:
                 task_type = analysis_data.get("type", "complex")
-                if task_type not in ["simple", "complex"]:
+                if task_type not in ("simple", "complex"):
                     task_type = "complex"  # Default to complex if unclear
             
             # Ensure duration is passed through unchanged
@@ -325,8 +408,7 @@ Analyze the task and return JSON:
         except Exception as e:
             print(f"Warning: Task difficulty analysis failed for '{query}': {e}")
             # Return default analysis
-            calendars = self._fetch_calendars()
-            work_home_ids = self._find_work_home_calendars(calendars)
+            work_home_ids = self._get_work_home_calendars()
             default_calendar = work_home_ids.get('work_id') or work_home_ids.get('home_id')
             
             # Determine type based on duration
@@ -5,5 +5,20 @@ Test suite for agents components.
 All test files use relative imports from the parent directory.
 Run tests from the agents directory or use absolute paths.
 """
+import os
+import tempfile
 
+_TMP_DIR = None
 
+
+def temp_db_path(name: str) -> str:
+    """
+    Path for a test database in a temporary directory shared by the suite
+    
+    The directory is created on first use and removed at exit, so failed
+    runs leave no .db/-wal/-shm files in the working directory.
+    """
+    global _TMP_DIR
+    if _TMP_DIR is None:
+        _TMP_DIR = tempfile.TemporaryDirectory(prefix="calbridge_test_")
+    return os.path.join(_TMP_DIR.name, name)
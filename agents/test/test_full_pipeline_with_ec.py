@@ -20,6 +20,7 @@ from task_difficulty_analyzer import TaskDifficultyAnalyzer
 from llm_decomposer import LLMDecomposer
 from time_allotment_agent import TimeAllotmentAgent
 from event_creator_agent import EventCreatorAgent
+from test import temp_db_path
 
 
 def run_full_pipeline_with_ec(query: str, verbose: bool = True, db_path: str = None):
@@ -185,63 +186,63 @@ def run_full_pipeline_with_ec(query: str, verbose: bool = True, db_path: str = N
     # Step 8: Event Creator Agent
     if verbose:
         print("\n[Step 8] Event Creator Agent (EC)")
-    ec = EventCreatorAgent(db_path=db_path)
-    ec_result = None
-    
-    try:
-        if ta_result:
-            ta_dict = ta_result.to_dict()
-            
-            if ta_dict.get("type") == "simple":
-                # Create simple task event
-                create_result = ec.create_simple_task(ta_dict)
-                if create_result.success:
-                    ec_result = {
-                        "success": True,
-                        "type": "simple",
-                        "task_id": create_result.task_id,
-                        "calendar_event_id": create_result.calendar_event_id
-                    }
-                    if verbose:
-                        print(f"   ✅ Created simple task event")
-                        print(f"   Task ID: {create_result.task_id}")
-                        print(f"   Calendar Event ID: {create_result.calendar_event_id}")
-                else:
+    with EventCreatorAgent(db_path=db_path) as ec:
+        ec_result = None
+        
+        try:
+            if ta_result:
+                ta_dict = ta_result.to_dict()
+                
+                if ta_dict.get("type") == "simple":
+                    # Create simple task event
+                    create_result = ec.create_simple_task(ta_dict)
+                    if create_result.success:
+                        ec_result = {
+                            "success": True,
+                            "type": "simple",
+                            "task_id": create_result.task_id,
+                            "calendar_event_id": create_result.calendar_event_id
+                        }
+                        if verbose:
+                            print(f"   ✅ Created simple task event")
+                            print(f"   Task ID: {create_result.task_id}")
+                            print(f"   Calendar Event ID: {create_result.calendar_event_id}")
+                    else:
+                        ec_result = {
+                            "success": False,
+                            "error": create_result.error
+                        }
+                        if verbose:
+                            print(f"   ❌ Failed to create event: {create_result.error}")
+                
+                elif ta_dict.get("type") == "complex":
+                    # Create complex task events (subtasks only)
+                    create_result = ec.create_complex_task(ta_dict)
                     ec_result = {
-                        "success": False,
-                        "error": create_result.error
+                        "success": create_result["success"],
+                        "type": "complex",
+                        "created": create_result.get("created", []),
+                        "failed": create_result.get("failed", [])
                     }
                     if verbose:
-                        print(f"   ❌ Failed to create event: {create_result.error}")
-            
-            elif ta_dict.get("type") == "complex":
-                # Create complex task events (subtasks only)
-                create_result = ec.create_complex_task(ta_dict)
-                ec_result = {
-                    "success": create_result["success"],
-                    "type": "complex",
-                    "created": create_result.get("created", []),
-                    "failed": create_result.get("failed", [])
-                }
+                        if create_result["success"]:
+                            print(f"   ✅ Created {len(create_result['created'])} subtask events")
+                            for item in create_result["created"]:
+                                print(f"      - Task {item['task_id']}: Event {item['calendar_event_id']}")
+                        else:
+                            print(f"   ⚠️  Partial failure: {len(create_result.get('failed', []))} failed")
+            else:
                 if verbose:
-                    if create_result["success"]:
-                        print(f"   ✅ Created {len(create_result['created'])} subtask events")
-                        for item in create_result["created"]:
-                            print(f"      - Task {item['task_id']}: Event {item['calendar_event_id']}")
-                    else:
-                        print(f"   ⚠️  Partial failure: {len(create_result.get('failed', []))} failed")
-        else:
+                    print("   ⚠️  Cannot create events: missing TA output")
+        
+        except Exception as e:
             if verbose:
-                print("   ⚠️  Cannot create events: missing TA output")
-    
-    except Exception as e:
-        if verbose:
-            print(f"   ❌ Event creation failed: {e}")
-        results["ec_error"] = str(e)
-    
-    results["ec"] = ec_result
-    
-    return results
+                print(f"   ❌ Event creation failed: {e}")
+            results["ec_error"] = str(e)
+        
+        results["ec"] = ec_result
+        
+        return results
 
 
 def test_simple_task_full_pipeline():
@@ -251,7 +252,7 @@ def test_simple_task_full_pipeline():
     print("=" * 80)
     
     query = "Call mom tomorrow at 2pm for 30 minutes"
-    db_path = "test_full_pipeline_ec_simple.db"
+    db_path = temp_db_path("test_full_pipeline_ec_simple.db")
     
     results = run_full_pipeline_with_ec(query, verbose=True, db_path=db_path)
     
@@ -261,11 +262,6 @@ def test_simple_task_full_pipeline():
         assert ec_result["type"] == "simple", "Should be simple task"
         assert "calendar_event_id" in ec_result, "Should have calendar event ID"
         print("\n✅ Simple task pipeline with EC completed successfully!")
-        
-        # Cleanup
-        import os
-        if os.path.exists(db_path):
-            os.remove(db_path)
         return True
     else:
         print("\n❌ Simple task pipeline with EC failed")
@@ -281,7 +277,7 @@ def test_complex_task_full_pipeline():
     print("=" * 80)
     
     query = "Plan a 5-day Japan trip by Nov 15"
-    db_path = "test_full_pipeline_ec_complex.db"
+    db_path = temp_db_path("test_full_pipeline_ec_complex.db")
     
     results = run_full_pipeline_with_ec(query, verbose=True, db_path=db_path)
     
@@ -291,11 +287,6 @@ def test_complex_task_full_pipeline():
         assert ec_result["type"] == "complex", "Should be complex task"
         assert len(ec_result.get("created", [])) > 0, "Should have created events"
         print("\n✅ Complex task pipeline with EC completed successfully!")
-        
-        # Cleanup
-        import os
-        if os.path.exists(db_path):
-            os.remove(db_path)
         return True
     else:
         print("\n❌ Complex task pipeline with EC failed")
@@ -233,6 +233,41 @@ def test_calendar_selection():
             print(f"  '{query}' → Error: {e}")
 
 
+class _InvalidCalendarLLM:
+    """Stand-in LLM that always answers with a calendar ID that does not exist"""
+    
+    def invoke(self, prompt):
+        return '{"calendar": "bogus", "type": "simple", "title": "Task"}'
+
+
+def test_keyword_calendar_repair():
+    """Test an invalid calendar ID is repaired from keywords found in the query"""
+    print("\n🔍 TESTING KEYWORD CALENDAR REPAIR")
+    print("=" * 80)
+    
+    analyzer = TaskDifficultyAnalyzer()
+    analyzer._work_home_ids = {"work_id": "WORK", "home_id": "HOME"}
+    analyzer.llm = _InvalidCalendarLLM()
+    
+    cases = [
+        # (query, expected calendar) - keywords match anywhere in the query
+        ("Submit expense report", "WORK"),
+        ("Call mom's dentist", "HOME"),
+        ("Plan the deployment", "WORK"),
+        ("Cleaning the garage", "HOME"),
+        ("Weekend housework", "HOME"),
+        ("Dinner with family", "HOME"),
+        ("Gym session with the team", "WORK"),  # work wins when both match
+        ("Visit parents on Monday", "WORK"),  # "Monday" contains "nda"
+        ("Water the plants", "WORK"),  # no keyword, default to work
+    ]
+    
+    for query, expected in cases:
+        result = analyzer.analyze(query, None)
+        print(f"  '{query}' → {result.calendar}")
+        assert result.calendar == expected, query
+
+
 def test_user_examples():
     """Test with user-provided examples"""
     print("\n🔍 TESTING USER PROVIDED EXAMPLES")
@@ -392,6 +427,7 @@ def main():
         print("  python test_task_difficulty_analyzer.py --basic")
         print("  python test_task_difficulty_analyzer.py --duration")
         print("  python test_task_difficulty_analyzer.py --calendars")
+        print("  python test_task_difficulty_analyzer.py --keywords")
         print("  python test_task_difficulty_analyzer.py --user-examples")
         print("  python test_task_difficulty_analyzer.py --edge-cases")
         print("  python test_task_difficulty_analyzer.py --interactive")
@@ -407,6 +443,8 @@ def main():
         test_duration_preservation()
     elif arg == "--calendars":
         test_calendar_selection()
+    elif arg == "--keywords":
+        test_keyword_calendar_repair()
     elif arg == "--user-examples":
         test_user_examples()
     elif arg == "--edge-cases":
@@ -417,6 +455,7 @@ def main():
         test_basic_functionality()
         test_duration_preservation()
         test_calendar_selection()
+        test_keyword_calendar_repair()
         test_user_examples()
         test_edge_cases()
     else:
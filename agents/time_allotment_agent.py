@@ -7,14 +7,23 @@ This agent:
 3. Validates scheduled slots
 4. Generates IDs and formats output according to spec
 """
+import json
+import re
 import sys
 import uuid
 import requests
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # optional speedup; not in agents/requirements.txt
+    orjson = None
+
 # Import task_scheduler from parent directory
 sys.path.append(str(Path(__file__).parent.parent / "task_scheduler"))
 from task_scheduler import (
@@ -24,6 +33,25 @@ from task_scheduler import (
     ConstraintAdder
 )
 
+# Hour/minute components of ISO-8601 durations like PT1H30M
+_HOURS_RE = re.compile(r'(\d+)H')
+_MINUTES_RE = re.compile(r'(\d+)M')
+
+# Decoder for CalBridge /events bodies, which grow with the fetch window
+_json_loads = orjson.loads if orjson else json.loads
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse a CalBridge/TS ISO timestamp (trailing 'Z' allowed)
+    
+    Each event bound is parsed by the window filter, the free-slot sweep
+    and the busy check, so repeats are served from the cache; datetimes are
+    immutable, which makes sharing them safe.
+    """
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
 
 @dataclass
 class ScheduledSimpleTask:
@@ -108,6 +136,11 @@ class TimeAllotmentAgent:
             work_end_hour: End of work day (24-hour format, default 11 PM)
         """
         self.calbridge_base_url = calbridge_base_url
+        
+        # Keep-alive session so repeated /events fetches reuse one connection
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        
         self.schedule_options = ScheduleOptions(
             work_start_hour=work_start_hour,
             work_end_hour=work_end_hour
@@ -132,25 +165,29 @@ class TimeAllotmentAgent:
         """
         try:
             # Calculate days from start to end
-            start_dt = datetime.fromisoformat(start_iso.replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(end_iso.replace('Z', '+00:00'))
+            start_dt = _parse_iso(start_iso)
+            end_dt = _parse_iso(end_iso)
+            local_tz = datetime.now().astimezone().tzinfo
             if start_dt.tzinfo is None:
-                start_dt = start_dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
+                start_dt = start_dt.replace(tzinfo=local_tz)
             if end_dt.tzinfo is None:
-                end_dt = end_dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
+                end_dt = end_dt.replace(tzinfo=local_tz)
             
             days_span = (end_dt - start_dt).days + 1
             days_to_fetch = min(max(days_span, 1), 365)  # Cap at 365 days
             
             # Fetch events
-            response = requests.get(
+            response = self.session.get(
                 f"{self.calbridge_base_url}/events",
                 params={"days": days_to_fetch, "calendar_id": calendar_id},
                 timeout=20
             )
             response.raise_for_status()
             
-            events = response.json()
+            try:
+                events = _json_loads(response.content)
+            except ValueError as e:
+                raise RuntimeError(f"Failed to fetch events from CalBridge: {e}")
             
             # Filter events in window and exclude holidays
             filtered_events = []
@@ -158,8 +195,8 @@ class TimeAllotmentAgent:
                 if self._is_holiday(event):
                     continue
                 
-                event_start = datetime.fromisoformat(event["start_iso"].replace('Z', '+00:00'))
-                event_end = datetime.fromisoformat(event["end_iso"].replace('Z', '+00:00'))
+                event_start = _parse_iso(event["start_iso"])
+                event_end = _parse_iso(event["end_iso"])
                 
                 # Check if event overlaps with window
                 if event_start < end_dt and event_end > start_dt:
@@ -182,24 +219,24 @@ class TimeAllotmentAgent:
         Returns:
             List of free slot tuples (start_iso, end_iso)
         """
-        start_dt = datetime.fromisoformat(start_iso.replace('Z', '+00:00'))
-        end_dt = datetime.fromisoformat(end_iso.replace('Z', '+00:00'))
+        start_dt = _parse_iso(start_iso)
+        end_dt = _parse_iso(end_iso)
         
+        local_tz = datetime.now().astimezone().tzinfo
         if start_dt.tzinfo is None:
-            start_dt = start_dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
+            start_dt = start_dt.replace(tzinfo=local_tz)
         if end_dt.tzinfo is None:
-            end_dt = end_dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
+            end_dt = end_dt.replace(tzinfo=local_tz)
         
-        # Sort events by start time
-        sorted_events = sorted(events, key=lambda x: x["start_iso"])
+        # Sort events by start time, parsing each bound once; comparing the
+        # datetimes rather than the ISO text keeps mixed UTC offsets in order
+        busy = sorted((_parse_iso(event["start_iso"]), _parse_iso(event["end_iso"]))
+                      for event in events)
         
         free_slots = []
         current_time = start_dt
         
-        for event in sorted_events:
-            event_start = datetime.fromisoformat(event["start_iso"].replace('Z', '+00:00'))
-            event_end = datetime.fromisoformat(event["end_iso"].replace('Z', '+00:00'))
-            
+        for event_start, event_end in busy:
             # Skip events completely before current time
             if event_end <= current_time:
                 continue
@@ -236,63 +273,97 @@ class TimeAllotmentAgent:
         Returns:
             Duration in minutes
         """
-        import re
-        
         duration = duration.upper()
         hours = 0
         minutes = 0
         
-        hours_match = re.search(r'(\d+)H', duration)
+        hours_match = _HOURS_RE.search(duration)
         if hours_match:
             hours = int(hours_match.group(1))
         
-        minutes_match = re.search(r'(\d+)M', duration)
+        minutes_match = _MINUTES_RE.search(duration)
         if minutes_match:
             minutes = int(minutes_match.group(1))
         
         return hours * 60 + minutes
     
+    def _parse_busy_intervals(self, events: List[Dict]) -> List[Tuple[datetime, datetime, str]]:
+        """
+        Parse busy events into timezone-aware intervals
+        
+        Done once per scheduling call so validating each subtask slot does
+        not re-parse every event.
+        
+        Args:
+            events: List of busy events
+            
+        Returns:
+            List of (start, end, title) tuples
+        """
+        local_tz = datetime.now().astimezone().tzinfo
+        intervals = []
+        for event in events:
+            event_start = _parse_iso(event["start_iso"])
+            event_end = _parse_iso(event["end_iso"])
+            
+            if event_start.tzinfo is None:
+                event_start = event_start.replace(tzinfo=local_tz)
+            if event_end.tzinfo is None:
+                event_end = event_end.replace(tzinfo=local_tz)
+            
+            intervals.append((event_start, event_end, event.get('title', 'unknown')))
+        return intervals
+    
+    def _parse_window(self, window_start: str, window_end: str) -> Tuple[datetime, datetime]:
+        """
+        Parse the TS window bounds, assuming local time when no offset is given
+        
+        Args:
+            window_start: Window start (ISO)
+            window_end: Window end (ISO)
+            
+        Returns:
+            (window_start_dt, window_end_dt), both timezone-aware
+        """
+        window_start_dt = _parse_iso(window_start)
+        window_end_dt = _parse_iso(window_end)
+        
+        local_tz = datetime.now().astimezone().tzinfo
+        if window_start_dt.tzinfo is None:
+            window_start_dt = window_start_dt.replace(tzinfo=local_tz)
+        if window_end_dt.tzinfo is None:
+            window_end_dt = window_end_dt.replace(tzinfo=local_tz)
+        return window_start_dt, window_end_dt
+    
     def _validate_scheduled_slot(self, 
-                                 slot_start: str, 
-                                 slot_end: str, 
+                                 slot_start_dt: datetime, 
+                                 slot_end_dt: datetime, 
                                  required_duration_min: int,
-                                 window_start: str,
-                                 window_end: str,
-                                 busy_events: List[Dict]) -> Tuple[bool, Optional[str]]:
+                                 window: Tuple[datetime, datetime],
+                                 busy_intervals: List[Tuple[datetime, datetime, str]]) -> Tuple[bool, Optional[str]]:
         """
         Validate a scheduled slot against constraints
         
+        Everything arrives parsed and timezone-aware, so validating each
+        subtask of a complex task is comparisons only.
+        
         Args:
-            slot_start: Scheduled start time (ISO)
-            slot_end: Scheduled end time (ISO)
+            slot_start_dt: Scheduled start time
+            slot_end_dt: Scheduled end time
             required_duration_min: Required duration in minutes
-            window_start: Window start (ISO)
-            window_end: Window end (ISO)
-            busy_events: List of busy events
+            window: Window bounds from _parse_window()
+            busy_intervals: Busy events from _parse_busy_intervals()
             
         Returns:
             (is_valid, error_message)
         """
-        slot_start_dt = datetime.fromisoformat(slot_start.replace('Z', '+00:00'))
-        slot_end_dt = datetime.fromisoformat(slot_end.replace('Z', '+00:00'))
-        window_start_dt = datetime.fromisoformat(window_start.replace('Z', '+00:00'))
-        window_end_dt = datetime.fromisoformat(window_end.replace('Z', '+00:00'))
-        
-        # Normalize timezones
-        if slot_start_dt.tzinfo is None:
-            slot_start_dt = slot_start_dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
-        if slot_end_dt.tzinfo is None:
-            slot_end_dt = slot_end_dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
-        if window_start_dt.tzinfo is None:
-            window_start_dt = window_start_dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
-        if window_end_dt.tzinfo is None:
-            window_end_dt = window_end_dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
+        window_start_dt, window_end_dt = window
         
         # Check bounds
         if slot_start_dt < window_start_dt:
-            return False, f"Slot starts before window: {slot_start} < {window_start}"
+            return False, f"Slot starts before window: {slot_start_dt.isoformat()} < {window_start_dt.isoformat()}"
         if slot_end_dt > window_end_dt:
-            return False, f"Slot ends after window: {slot_end} > {window_end}"
+            return False, f"Slot ends after window: {slot_end_dt.isoformat()} > {window_end_dt.isoformat()}"
         if slot_start_dt >= slot_end_dt:
             return False, f"Invalid slot: start >= end"
         
@@ -302,18 +373,9 @@ class TimeAllotmentAgent:
             return False, f"Duration mismatch: expected {required_duration_min} min, got {actual_duration_min} min"
         
         # Check busy compliance
-        for event in busy_events:
-            event_start = datetime.fromisoformat(event["start_iso"].replace('Z', '+00:00'))
-            event_end = datetime.fromisoformat(event["end_iso"].replace('Z', '+00:00'))
-            
-            if event_start.tzinfo is None:
-                event_start = event_start.replace(tzinfo=datetime.now().astimezone().tzinfo)
-            if event_end.tzinfo is None:
-                event_end = event_end.replace(tzinfo=datetime.now().astimezone().tzinfo)
-            
-            # Check overlap
+        for event_start, event_end, event_title in busy_intervals:
             if slot_start_dt < event_end and slot_end_dt > event_start:
-                return False, f"Overlaps with busy event: {event.get('title', 'unknown')}"
+                return False, f"Overlaps with busy event: {event_title}"
         
         return True, None
     
@@ -361,14 +423,14 @@ class TimeAllotmentAgent:
         # Convert free slots to task_scheduler format (timezone-naive)
         raw_slots = []
         for slot_start, slot_end in free_slots:
-            start_dt = datetime.fromisoformat(slot_start.replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(slot_end.replace('Z', '+00:00'))
+            start_dt = _parse_iso(slot_start)
+            end_dt = _parse_iso(slot_end)
             # Convert to timezone-naive for task_scheduler
             raw_slots.append((start_dt.replace(tzinfo=None).isoformat(), 
                             end_dt.replace(tzinfo=None).isoformat()))
         
         # Convert deadline to timezone-naive
-        deadline_dt = datetime.fromisoformat(window_end.replace('Z', '+00:00'))
+        deadline_dt = _parse_iso(window_end)
         deadline_naive = deadline_dt.replace(tzinfo=None).isoformat()
         
         # Schedule task
@@ -388,9 +450,8 @@ class TimeAllotmentAgent:
             
             # Convert back to timezone-aware ISO format
             # Preserve timezone from window_start
-            window_start_dt = datetime.fromisoformat(window_start.replace('Z', '+00:00'))
-            if window_start_dt.tzinfo is None:
-                window_start_dt = window_start_dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
+            window = self._parse_window(window_start, window_end)
+            window_start_dt = window[0]
             
             # Apply timezone to scheduler output (which is timezone-naive)
             slot_start_dt = assignment.start.replace(tzinfo=window_start_dt.tzinfo)
@@ -401,12 +462,11 @@ class TimeAllotmentAgent:
             
             # Validate the scheduled slot
             is_valid, error_msg = self._validate_scheduled_slot(
-                slot_start_iso,
-                slot_end_iso,
+                slot_start_dt,
+                slot_end_dt,
                 duration_min,
-                window_start,
-                window_end,
-                events
+                window,
+                self._parse_busy_intervals(events)
             )
             
             if not is_valid:
@@ -481,13 +541,13 @@ class TimeAllotmentAgent:
         # Convert free slots to task_scheduler format (timezone-naive)
         raw_slots = []
         for slot_start, slot_end in free_slots:
-            start_dt = datetime.fromisoformat(slot_start.replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(slot_end.replace('Z', '+00:00'))
+            start_dt = _parse_iso(slot_start)
+            end_dt = _parse_iso(slot_end)
             raw_slots.append((start_dt.replace(tzinfo=None).isoformat(), 
                             end_dt.replace(tzinfo=None).isoformat()))
         
         # Convert deadline to timezone-naive
-        deadline_dt = datetime.fromisoformat(window_end.replace('Z', '+00:00'))
+        deadline_dt = _parse_iso(window_end)
         deadline_naive = deadline_dt.replace(tzinfo=None).isoformat()
         
         # Add constraints for precedence (min gap between subtasks)
@@ -510,63 +570,53 @@ class TimeAllotmentAgent:
             # Sort assignments by task_id to maintain order
             assignments.sort(key=lambda a: a.task_id)
             
-            # Validate all scheduled slots
+            # Validate all scheduled slots; the window, busy events and local
+            # offset are resolved once here rather than once per subtask
+            local_tz = datetime.now().astimezone().tzinfo
+            window = self._parse_window(window_start, window_end)
+            busy_intervals = self._parse_busy_intervals(events)
             for i, assignment in enumerate(assignments):
-                slot_start_iso = assignment.start.isoformat()
-                slot_end_iso = assignment.end.isoformat()
+                slot_start_dt = assignment.start
+                slot_end_dt = assignment.end
+                if slot_start_dt.tzinfo is None:
+                    slot_start_dt = slot_start_dt.replace(tzinfo=local_tz)
+                if slot_end_dt.tzinfo is None:
+                    slot_end_dt = slot_end_dt.replace(tzinfo=local_tz)
                 
                 is_valid, error_msg = self._validate_scheduled_slot(
-                    slot_start_iso,
-                    slot_end_iso,
+                    slot_start_dt,
+                    slot_end_dt,
                     subtask_durations_min[i],
-                    window_start,
-                    window_end,
-                    events
+                    window,
+                    busy_intervals
                 )
                 
                 if not is_valid:
                     raise RuntimeError(f"Validation failed for subtask {i}: {error_msg}")
             
             # Validate order (precedence: each starts >= previous ends)
+            # Assignments already hold datetimes, so compare them directly
+            # instead of round-tripping through isoformat()/fromisoformat()
             for i in range(1, len(assignments)):
-                prev_end = datetime.fromisoformat(assignments[i-1].end.isoformat())
-                curr_start = datetime.fromisoformat(assignments[i].start.isoformat())
+                prev_end = assignments[i-1].end
+                curr_start = assignments[i].start
                 if prev_end.tzinfo is None:
-                    prev_end = prev_end.replace(tzinfo=datetime.now().astimezone().tzinfo)
+                    prev_end = prev_end.replace(tzinfo=local_tz)
                 if curr_start.tzinfo is None:
-                    curr_start = curr_start.replace(tzinfo=datetime.now().astimezone().tzinfo)
+                    curr_start = curr_start.replace(tzinfo=local_tz)
                 
                 if curr_start < prev_end:
                     raise RuntimeError(f"Precedence violation: subtask {i} starts before subtask {i-1} ends")
             
-            # Validate non-overlap
-            for i in range(len(assignments)):
-                for j in range(i + 1, len(assignments)):
-                    slot_i_start = datetime.fromisoformat(assignments[i].start.isoformat())
-                    slot_i_end = datetime.fromisoformat(assignments[i].end.isoformat())
-                    slot_j_start = datetime.fromisoformat(assignments[j].start.isoformat())
-                    slot_j_end = datetime.fromisoformat(assignments[j].end.isoformat())
-                    
-                    if slot_i_start.tzinfo is None:
-                        slot_i_start = slot_i_start.replace(tzinfo=datetime.now().astimezone().tzinfo)
-                    if slot_i_end.tzinfo is None:
-                        slot_i_end = slot_i_end.replace(tzinfo=datetime.now().astimezone().tzinfo)
-                    if slot_j_start.tzinfo is None:
-                        slot_j_start = slot_j_start.replace(tzinfo=datetime.now().astimezone().tzinfo)
-                    if slot_j_end.tzinfo is None:
-                        slot_j_end = slot_j_end.replace(tzinfo=datetime.now().astimezone().tzinfo)
-                    
-                    if slot_i_start < slot_j_end and slot_i_end > slot_j_start:
-                        raise RuntimeError(f"Overlap detected between subtasks {i} and {j}")
+            # No separate overlap check: every slot has start < end (checked
+            # above), so slots that pass precedence are already disjoint
             
             # Generate IDs
             parent_id = str(uuid.uuid4())
             scheduled_subtasks = []
             
             # Preserve timezone from window_start
-            window_start_dt = datetime.fromisoformat(window_start.replace('Z', '+00:00'))
-            if window_start_dt.tzinfo is None:
-                window_start_dt = window_start_dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
+            window_start_dt = window[0]
             
             for i, assignment in enumerate(assignments):
                 subtask_id = str(uuid.uuid4())
@@ -30,7 +30,11 @@ class TimeStandardization(BaseModel):
 class TimeStandardizer:
     """Time Standardizer for converting absolute text to ISO formats"""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
+        # Step-by-step trace of standardize(); off by default since the
+        # orchestrator reports the result itself
+        self.verbose = verbose
+        
         # Canonical format regex: "Month DD, YYYY HH:MM am/pm"
         self.canonical_regex = re.compile(
             r'^([A-Za-z]+)\s+(\d{2}),\s+(\d{4})\s+(\d{2}):(\d{2})\s+(am|pm)$',
@@ -48,6 +52,14 @@ class TimeStandardizer:
             r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})([+-]\d{2}:\d{2}|Z)$'
         )
         
+        # Duration regexes ("30 min", "2h", "2h30m", "1.5 hours")
+        self.duration_minutes_regex = re.compile(r'^(\d+)\s*(m|min|mins|minute|minutes)$')
+        self.duration_hours_regex = re.compile(r'^(\d+)\s*(h|hr|hrs|hour|hours)$')
+        self.duration_compound_regex = re.compile(
+            r'^(\d+)\s*(h|hr|hrs|hour|hours)\s*(\d+)\s*(m|min|mins|minute|minutes)$'
+        )
+        self.duration_decimal_regex = re.compile(r'^(\d+\.\d+)\s*(h|hr|hrs|hour|hours)$')
+        
         # Month name mapping
         self.month_map = {
             'january': 1, 'february': 2, 'march': 3, 'april': 4,
@@ -129,6 +141,25 @@ class TimeStandardizer:
         except ValueError:
             return None
     
+    def _parse_datetime_text(self, text: str) -> Optional[datetime]:
+        """
+        Parse AR output text by dispatching on its shape to the one format
+        that can match, instead of trying each format in turn
+        """
+        stripped = text.strip()
+        if stripped[:1].isdigit():
+            # "YYYY-MM-DDTHH:MM:SS±HH:MM" (fallback for faulty AR output)
+            return self._parse_iso_format(stripped)
+        
+        comma = stripped.find(',')
+        space = stripped.find(' ')
+        if comma != -1 and (space == -1 or comma < space):
+            # "Weekday, Month DD, YYYY HH:MM am/pm"
+            return self._parse_extended_format(stripped)
+        
+        # "Month DD, YYYY HH:MM am/pm"
+        return self._parse_canonical_format(stripped)
+    
     def _apply_timezone(self, dt: datetime, timezone: str) -> datetime:
         """
         Apply timezone to datetime and return timezone-aware datetime
@@ -220,24 +251,26 @@ class TimeStandardizer:
         duration = duration.strip().lower()
         
         # Minutes
-        if re.match(r'^\d+\s*(m|min|mins|minute|minutes)$', duration):
-            minutes = int(re.search(r'\d+', duration).group())
+        minutes_match = self.duration_minutes_regex.match(duration)
+        if minutes_match:
+            minutes = int(minutes_match.group(1))
             return f"PT{minutes}M"
         
         # Hours
-        if re.match(r'^\d+\s*(h|hr|hrs|hour|hours)$', duration):
-            hours = int(re.search(r'\d+', duration).group())
+        hours_match = self.duration_hours_regex.match(duration)
+        if hours_match:
+            hours = int(hours_match.group(1))
             return f"PT{hours}H"
         
         # Hour + minute compounds (2h30m, 2 h 30 m, etc.)
-        compound_match = re.match(r'^(\d+)\s*(h|hr|hrs|hour|hours)\s*(\d+)\s*(m|min|mins|minute|minutes)$', duration)
+        compound_match = self.duration_compound_regex.match(duration)
         if compound_match:
             hours = int(compound_match.group(1))
             minutes = int(compound_match.group(3))
             return f"PT{hours}H{minutes}M"
         
         # Decimals (1.5h)
-        decimal_match = re.match(r'^(\d+\.\d+)\s*(h|hr|hrs|hour|hours)$', duration)
+        decimal_match = self.duration_decimal_regex.match(duration)
         if decimal_match:
             hours_float = float(decimal_match.group(1))
             hours = int(hours_float)
@@ -274,71 +307,65 @@ class TimeStandardizer:
         if not start_text or not end_text:
             raise ValueError("Both start_text and end_text are required")
         
-        print(f"🔄 Time Standardizer: Processing AR output")
-        print(f"   • Start: {start_text}")
-        print(f"   • End: {end_text}")
-        print(f"   • Duration: {duration}")
-        print(f"   • Timezone: {timezone}")
+        if self.verbose:
+            print(f"🔄 Time Standardizer: Processing AR output")
+            print(f"   • Start: {start_text}")
+            print(f"   • End: {end_text}")
+            print(f"   • Duration: {duration}")
+            print(f"   • Timezone: {timezone}")
         
         # Parse start_text
-        start_dt = self._parse_canonical_format(start_text)
+        start_dt = self._parse_datetime_text(start_text)
         if not start_dt:
-            # Try extended format (with weekday)
-            start_dt = self._parse_extended_format(start_text)
-        if not start_dt:
-            # Try ISO format as fallback
-            start_dt = self._parse_iso_format(start_text)
-            if not start_dt:
-                raise ValueError(f"Could not parse start_text: {start_text}")
+            raise ValueError(f"Could not parse start_text: {start_text}")
         
         # Parse end_text
-        end_dt = self._parse_canonical_format(end_text)
-        if not end_dt:
-            # Try extended format (with weekday)
-            end_dt = self._parse_extended_format(end_text)
+        end_dt = self._parse_datetime_text(end_text)
         if not end_dt:
-            # Try ISO format as fallback
-            end_dt = self._parse_iso_format(end_text)
-            if not end_dt:
-                raise ValueError(f"Could not parse end_text: {end_text}")
+            raise ValueError(f"Could not parse end_text: {end_text}")
         
-        print(f"   • Parsed start: {start_dt}")
-        print(f"   • Parsed end: {end_dt}")
+        if self.verbose:
+            print(f"   • Parsed start: {start_dt}")
+            print(f"   • Parsed end: {end_dt}")
         
         # Apply timezone
         start_dt = self._apply_timezone(start_dt, timezone)
         end_dt = self._apply_timezone(end_dt, timezone)
         
-        print(f"   • With timezone: {start_dt} -> {end_dt}")
+        if self.verbose:
+            print(f"   • With timezone: {start_dt} -> {end_dt}")
         
         # Determine seconds (EOD semantics)
         is_eod = end_text.strip().endswith('11:59 pm')
         start_dt = self._determine_seconds(start_dt, False)
         end_dt = self._determine_seconds(end_dt, is_eod)
         
-        print(f"   • With seconds: {start_dt} -> {end_dt}")
+        if self.verbose:
+            print(f"   • With seconds: {start_dt} -> {end_dt}")
         
         # Time validation and adjustment for past times
         now = datetime.now(pytz.timezone(timezone))
         start_dt, end_dt, time_adjustment_note = self._adjust_past_times(start_dt, end_dt, now)
-        if time_adjustment_note:
+        if time_adjustment_note and self.verbose:
             print(f"   • ⚠️  {time_adjustment_note}")
         
         # Enforce invariant (start <= end)
         start_dt, end_dt, repair_note = self._enforce_invariant(start_dt, end_dt)
-        if repair_note:
+        if repair_note and self.verbose:
             print(f"   • ⚠️  {repair_note}")
         
         # Convert to ISO format
         start_iso = start_dt.isoformat()
         end_iso = end_dt.isoformat()
         
-        print(f"   • ISO start: {start_iso}")
-        print(f"   • ISO end: {end_iso}")
+        if self.verbose:
+            print(f"   • ISO start: {start_iso}")
+            print(f"   • ISO end: {end_iso}")
         
         # Normalize duration
         duration_iso = self._normalize_duration(duration)
-        print(f"   • Duration ISO: {duration_iso}")
+        if self.verbose:
+            print(f"   • Duration ISO: {duration_iso}")
         
         return TimeStandardization(
             start=start_iso,
@@ -373,7 +400,7 @@ class TimeStandardizer:
 
 # Example usage
 if __name__ == "__main__":
-    standardizer = TimeStandardizer()
+    standardizer = TimeStandardizer(verbose=True)
     
     # Test cases from the spec
     test_cases = [
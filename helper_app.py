@@ -9,6 +9,7 @@ from AppKit import NSApplication
 from EventKit import EKEventStore, EKEntityTypeEvent, EKAuthorizationStatusAuthorized
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import uvicorn
 from EventKit import EKEntityTypeEvent
@@ -95,6 +96,10 @@ class EventIn(BaseModel):
 
 
 
+class EventBatchIn(BaseModel):
+    events: List[EventIn]
+
+
 class EventOut(BaseModel):
     title: str
     start_iso: str
@@ -103,7 +108,7 @@ class EventOut(BaseModel):
     calendar: Optional[str] = None
 
 # ---------- API ----------
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 @app.get("/status")
 def status():
@@ -177,6 +182,52 @@ def add(ev: EventIn) -> EventOut:
     )
 
 
+@app.post("/add_batch")
+def add_batch(batch: EventBatchIn) -> List[EventOut]:
+    from EventKit import EKEvent
+    # parse every date and resolve every calendar first, so a bad entry
+    # rejects the batch before anything is staged in the shared store
+    parsed = []
+    for ev in batch.events:
+        try:
+            start = datetime.fromisoformat(ev.start_iso)
+            end   = datetime.fromisoformat(ev.end_iso)
+        except ValueError as err:
+            raise HTTPException(status_code=400, detail=f"invalid date for {ev.title!r}: {err}")
+        cal = resolve_calendar_or_error(ev.calendar_id, ev.calendar_title)
+        parsed.append((ev, cal, start, end))
+
+    saved = []
+    for ev, cal, start, end in parsed:
+        e = EKEvent.eventWithEventStore_(store)
+        e.setTitle_(ev.title)
+        e.setStartDate_(nsdate(start))
+        e.setEndDate_(nsdate(end))
+        if ev.notes:
+            e.setNotes_(ev.notes)
+        e.setCalendar_(cal)
+        ok, err = store.saveEvent_span_commit_error_(e, 0, False, None)
+        if not ok:
+            # drop the staged events so the next /add or /delete does not commit them
+            store.reset()
+            raise HTTPException(status_code=500, detail=f"failed to save {ev.title!r}: {err}")
+        saved.append((ev, cal, start, end, e))
+    # one commit for the whole batch
+    ok, err = store.commit_(None)
+    if not ok:
+        store.reset()
+        raise HTTPException(status_code=500, detail=f"failed to commit batch: {err}")
+
+    return [
+        EventOut(
+            title=ev.title,
+            start_iso=start.isoformat(),
+            end_iso=end.isoformat(),
+            id=str(e.eventIdentifier()),
+            calendar=str(cal.title() or "")
+        )
+        for ev, cal, start, end, e in saved
+    ]
 
 
 @app.post("/delete")
@@ -1,13 +1,18 @@
-import os, json, requests, pathlib
+import os, orjson, requests, pathlib, tempfile
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE = os.getenv("CALBRIDGE_BASE", "http://127.0.0.1:8765")
 OUT = pathlib.Path(__file__).resolve().parents[1] / "config" / "calendars.json"
 OUT.parent.mkdir(parents=True, exist_ok=True)
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=50,
+                                     max_retries=Retry(total=2, backoff_factor=0.1)))
 
 def main():
-    r = requests.get(f"{BASE}/calendars", timeout=10)
+    r = SESSION.get(f"{BASE}/calendars", timeout=10)
     r.raise_for_status()
-    cals = r.json()
+    cals = orjson.loads(r.content)
     data = {
         "default_work_title": "Work",
         "default_home_title": "Home",
@@ -16,7 +21,15 @@ def main():
             for c in cals
         ]
     }
-    OUT.write_text(json.dumps(data, indent=2))
+    # write-then-rename so nl_to_event never reads a half-written cache
+    fd, tmp = tempfile.mkstemp(dir=OUT.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, OUT)
+    except BaseException:
+        os.unlink(tmp)
+        raise
     print(f"wrote {OUT} with {len(cals)} calendars")
 
 if __name__ == "__main__":
@@ -1,9 +1,14 @@
 import os, json, requests, argparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from dateutil import tz
 
 BASE = os.getenv("CALBRIDGE_BASE", "http://127.0.0.1:8765")
 TZ = os.getenv("TIMEZONE", "America/New_York")
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=50,
+                                     max_retries=Retry(total=2, backoff_factor=0.1)))
 
 def iso_in_tz(dt: datetime) -> str:
     if dt.tzinfo is None:
@@ -34,7 +39,7 @@ def main():
     elif args.calendar_title:
         payload["calendar_title"] = args.calendar_title
 
-    r = requests.post(f"{BASE}/add", json=payload, timeout=10)
+    r = SESSION.post(f"{BASE}/add", json=payload, timeout=10)
     print("STATUS:", r.status_code)
     print(r.text)
 
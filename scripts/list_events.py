@@ -1,7 +1,12 @@
-import os, requests, argparse
+import os, orjson, requests, argparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 
 BASE = os.getenv("CALBRIDGE_BASE", "http://127.0.0.1:8765")
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=50,
+                                     max_retries=Retry(total=2, backoff_factor=0.1)))
 
 def main():
     ap = argparse.ArgumentParser()
@@ -19,9 +24,10 @@ def main():
     if args.exclude_holidays:
         params["exclude_holidays"] = True
 
-    evs = requests.get(f"{BASE}/events", params=params, timeout=15).json()
+    evs = orjson.loads(SESSION.get(f"{BASE}/events", params=params, timeout=15).content)
     print(f"Found {len(evs)} events in next {args.days} days:")
-    for e in sorted(evs, key=lambda x: x["start_iso"]):
+    # /events already returns events ordered by start date
+    for e in evs:
         s = datetime.fromisoformat(e["start_iso"]).strftime("%Y-%m-%d %H:%M")
         en = datetime.fromisoformat(e["end_iso"]).strftime("%H:%M")
         print(f"- {s} → {en} | {e['title']} [{e.get('calendar','')}] id={e['id']}")
@@ -1,15 +1,49 @@
-import os, json, requests, argparse, re
+import os, json, requests, argparse, re, hashlib, functools, tempfile, time
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from dateutil import tz, parser as dateparser
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 CALBRIDGE_BASE = os.getenv("CALBRIDGE_BASE", "http://127.0.0.1:8765")
 OLLAMA_BASE = os.getenv("OLLAMA_BASE", "http://127.0.0.1:11434")
 MODEL = os.getenv("OLLAMA_MODEL", "gemma3")
 TZNAME = os.getenv("TIMEZONE", "America/New_York")
+_TZ = tz.gettz(TZNAME)
 
 CACHE_PATH = Path(__file__).resolve().parents[1] / "config" / "calendars.json"
 
+# one keep-alive session for both Ollama and CalBridge
+_SESSION = requests.Session()
+_SESSION.headers.update({"Connection": "keep-alive"})
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                      max_retries=Retry(total=2, backoff_factor=0.1)))
+# Ollama chat POSTs are safe to repeat, so a busy model's 502/503/504 is
+# retried too; CalBridge /add is not, and keeps the connection-only policy
+# above. raise_on_status=False hands the last error to raise_for_status().
+_SESSION.mount(OLLAMA_BASE, HTTPAdapter(
+    pool_connections=1, pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.25, status_forcelist=(502, 503, 504),
+                      allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+                      raise_on_status=False)))
+
+_ISO_LOCAL_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}$")
+_JSON_DECODER = json.JSONDecoder()
+
+# parsed model replies keyed by (model, text, now_local hour) so repeats skip Ollama;
+# kept in memory and, unless clock-relative, mirrored to disk so separate runs
+# share them for an hour
+_RESPONSE_CACHE = {}
+# phrasings measured from the current clock time; an hour bucket would replay
+# "in 2 hours" asked at 10:05 as the 12:05 answer at 10:55
+_CLOCK_RELATIVE_RE = re.compile(
+    r"\b(?:in\s+(?:\d+(?:\.\d+)?|an?|half\s+an)\s*(?:m|mins?|minutes?|h|hrs?|hours?)\b"
+    r"|right\s+now|now|later|soon|asap)\b", re.I)
+LLM_CACHE_DIR = CACHE_PATH.parent / "llm_cache"
+LLM_CACHE_TTL_S = 3600
+
 SYSTEM_PROMPT = """You convert a natural sentence into STRICT JSON for creating ONE calendar event.
 Return ONLY valid JSON and nothing else.
 
@@ -22,7 +56,7 @@ Schema:
 }
 
 Context:
-- now_local = {NOW_LOCAL}  (timezone: {TZ})
+- The user message starts with now_local=... and TZ=... lines, followed by "---" and the request.
 - Treat all relative dates/times relative to now_local.
 
 Relative date/time rules (must follow):
@@ -44,67 +78,295 @@ Rules:
 - If they say Work/Home explicitly, set calendar_hint accordingly; otherwise infer if obvious; else null.
 """
 
+@functools.lru_cache(maxsize=1)
+def _parse_calendar_cache(mtime_ns: int):
+    data = orjson.loads(CACHE_PATH.read_bytes())
+    cals = data.get("calendars", [])
+    # parallel arrays of the only fields main reads, plus lowercase title -> index
+    ids = [c["id"] for c in cals]
+    writable = [bool(c.get("writable")) for c in cals]
+    index_by_title_lc = { (c["title"] or "").lower(): i for i, c in enumerate(cals) }
+    return index_by_title_lc, ids, writable
+
 def load_calendar_cache():
-    if not CACHE_PATH.exists():
+    # keyed on mtime so a refreshed cache file is re-read, otherwise reused
+    try:
+        mtime_ns = CACHE_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
         raise SystemExit(f"Calendar cache not found: {CACHE_PATH}. Run scripts/cache_calendars.py first.")
-    data = json.loads(CACHE_PATH.read_text())
-    # lowercase title -> entry
-    by_title_lc = { (c["title"] or "").lower(): c for c in data.get("calendars", []) }
-    return data, by_title_lc
+    return _parse_calendar_cache(mtime_ns)
 
 def iso_with_tz(local_dt_str: str) -> datetime:
-    # parse "YYYY-MM-DDTHH:MM" (no tz) as local TZ
-    dt = dateparser.parse(local_dt_str)
-    return dt.replace(tzinfo=tz.gettz(TZNAME))
+    # parse "YYYY-MM-DDTHH:MM" (no tz) as local TZ; dateutil only for off-schema output
+    if _ISO_LOCAL_RE.match(local_dt_str):
+        dt = datetime.fromisoformat(local_dt_str)
+    else:
+        dt = dateparser.parse(local_dt_str)
+    return dt.replace(tzinfo=_TZ)
 
-def extract_json_str(s: str) -> str:
+def extract_json(s: str) -> dict:
     """Be tolerant if the model wrapped JSON with text or code fences."""
-    s = s.strip()
-    # if it's already pure JSON, try directly
-    if s.startswith("{"):
-        # try to find the matching closing brace by simple stack
-        depth = 0
-        for i, ch in enumerate(s):
-            if ch == "{": depth += 1
-            elif ch == "}":
-                depth -= 1
-                if depth == 0:
-                    return s[:i+1]
-    # try code fence ```json ... ```
-    fence = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", s, flags=re.S)
-    if fence:
-        return fence.group(1)
-    # fallback: grab first {...} block
-    m = re.search(r"(\{.*\})", s, flags=re.S)
-    if m:
-        return m.group(1)
+    # let the C decoder find the first complete object, whether bare or fenced;
+    # the object it returns is the plan, so there is no second parse
+    idx = s.find("{")
+    while idx != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(s, idx)
+            return obj
+        except json.JSONDecodeError:
+            idx = s.find("{", idx + 1)
     raise ValueError("No JSON object found in model output.")
 
+# --- local fast path for common phrasings (falls back to Ollama on any miss) ---
+_MONTHS = {m: i for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)}
+_WEEKDAYS = {d: i for i, d in enumerate(["mon", "tue", "wed", "thu", "fri", "sat", "sun"])}
+_PART_OF_DAY = {"morning": (9, 0), "afternoon": (15, 0), "evening": (19, 0), "tonight": (19, 0),
+                "noon": (12, 0), "midnight": (0, 0)}
+
+# every supported date form in one alternation, so a single scan finds the first one;
+# weekday abbreviations only count after on/this/next ("in the sun" is not Sunday)
+_DATE_RE = re.compile(
+    r"\b(?:on\s+|for\s+)?(?:"
+    r"(?P<iso_y>\d{4})-(?P<iso_m>\d{1,2})-(?P<iso_d>\d{1,2})"
+    r"|(?P<mon>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(?P<mon_d>\d{1,2})(?:st|nd|rd|th)?(?:,?\s*(?P<mon_y>\d{4}))?"
+    r"|(?P<rel>day after tomorrow|today|tomorrow)"
+    r"|(?:(?P<wk_mod>this|next)\s+)?(?P<wk>monday|tuesday|wednesday|thursday|friday|saturday|sunday)"
+    r"|(?P<ab_mod>on|this|next)\s+(?P<ab>mon|tue|tues|wed|thu|thur|thurs|fri|sat|sun)"
+    r")\b", re.I)
+_TIME_RE = re.compile(
+    r"\b(?:at\s+)?(?:(\d{1,2})(?::(\d{2}))?\s*(am|pm)|(\d{1,2}):(\d{2})|(noon|midnight))\b", re.I)
+_PART_RE = re.compile(r"\b(?:in\s+the\s+|this\s+)?(morning|afternoon|evening|tonight)\b", re.I)
+_DURATION_RE = re.compile(r"\b(?:for\s+)?(\d+)\s*(minutes|minute|mins|min|hours|hour|hrs|hr)\b", re.I)
+_CAL_RE = re.compile(r"\b(work|home)\b", re.I)
+# the calendar is only taken from "<work|home> event/reminder"; anywhere else
+# the word may be a verb or a name ("work on", "home depot") and goes to the model
+_LEAD_RE = re.compile(
+    r"^(?:please\s+)?(?:create|schedule|add|book|set\s+up|put)?\s*(?:an?\s+)?"
+    r"(?:(?P<cal>work|home)\s+(?:event|reminder)|event|reminder)?\s*(?:for|to|:)?\s*", re.I)
+_TAIL_RE = re.compile(r"\s*[,.;:]?\s*$")
+# a title ending in one of these lost the phrase it introduced ("by Friday",
+# "every Monday"); one containing the others is a deadline or recurrence
+_DANGLING_WORDS = frozenset(["on", "at", "for", "in", "to", "by", "before", "after", "until",
+                             "till", "every", "each", "from", "due", "starting", "through"])
+_UNMODELLED_WORDS = frozenset(["every", "each", "daily", "weekly", "monthly", "yearly",
+                               "until", "till", "before", "by", "due", "deadline"])
+# a date word still in the title means a second or unparsed date ("not tomorrow but ...");
+# bare weekday abbreviations are ambiguous ("sat down", "in the sun"), so they defer too
+_DATE_WORDS = frozenset(["today", "tomorrow", "yesterday", "tonight", "weekend", "week",
+                         "mon", "tue", "tues", "wed", "thu", "thur", "thurs", "fri", "sat",
+                         "sun", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday",
+                         "sunday", "january", "february", "april", "june", "july",
+                         "september", "october", "november", "december"])
+# times are read as TIMEZONE wall time, so a stated zone needs the model
+_TZ_WORDS = frozenset(["utc", "gmt", "et", "est", "edt", "ct", "cst", "cdt", "mt", "mst",
+                       "mdt", "pt", "pst", "pdt", "akst", "akdt", "hst", "bst", "cet",
+                       "cest", "ist", "jst", "aest"])
+# the fast path only creates; any other request is the model's to interpret
+_NON_CREATE_VERBS = frozenset(["cancel", "delete", "remove", "clear", "drop", "reschedule",
+                               "move", "postpone", "push", "update", "change", "edit",
+                               "rename", "list", "show", "find", "check", "can", "could",
+                               "would", "will"])
+
+def _match_local_date(text: str, today):
+    """Find the first supported date phrase; returns (date, match) or (None, None)."""
+    m = _DATE_RE.search(text)
+    if not m:
+        return None, None
+    if m.group("iso_y"):
+        return datetime(int(m.group("iso_y")), int(m.group("iso_m")), int(m.group("iso_d"))).date(), m
+    if m.group("mon"):
+        year = int(m.group("mon_y")) if m.group("mon_y") else today.year
+        d = datetime(year, _MONTHS[m.group("mon").lower()], int(m.group("mon_d"))).date()
+        # a yearless date already past means next year, or a typo; let the model decide
+        if not m.group("mon_y") and d < today:
+            return None, None
+        return d, m
+    if m.group("rel"):
+        return today + timedelta(days={"today": 0, "tomorrow": 1}.get(m.group("rel").lower(), 2)), m
+    weekday = m.group("wk") or m.group("ab")
+    ahead = (_WEEKDAYS[weekday[:3].lower()] - today.weekday()) % 7
+    if (m.group("wk_mod") or m.group("ab_mod") or "").lower() == "next":
+        ahead += 7
+    return today + timedelta(days=ahead), m
+
+def _try_local_parse(text: str, now_local: datetime):
+    """Return a plan dict for simple phrasings, or None to defer to the model."""
+    try:
+        date, m = _match_local_date(text, now_local.date())
+    except ValueError:  # e.g. "Feb 30"
+        return None
+    if date is None:
+        return None
+    rest = text[:m.start()] + " " + text[m.end():]
+    # "tomorrow or friday": only one date is modelled
+    if _DATE_RE.search(rest):
+        return None
+
+    hour, minute = 10, 0
+    if (m := _TIME_RE.search(rest)):
+        if m.group(6):
+            hour, minute = _PART_OF_DAY[m.group(6).lower()]
+        elif m.group(3):
+            hour, minute = int(m.group(1)) % 12, int(m.group(2) or 0)
+            if m.group(3).lower() == "pm":
+                hour += 12
+        else:
+            hour, minute = int(m.group(4)), int(m.group(5))
+        rest = rest[:m.start()] + " " + rest[m.end():]
+    elif (m := _PART_RE.search(rest)):
+        hour, minute = _PART_OF_DAY[m.group(1).lower()]
+        rest = rest[:m.start()] + " " + rest[m.end():]
+    if hour > 23 or minute > 59:
+        return None
+
+    duration = 30
+    if (m := _DURATION_RE.search(rest)):
+        duration = int(m.group(1)) * (60 if m.group(2).lower().startswith("h") else 1)
+        rest = rest[:m.start()] + " " + rest[m.end():]
+
+    rest = " ".join(rest.split())
+    lead = _LEAD_RE.match(rest)
+    title = _TAIL_RE.sub("", rest[lead.end():])
+    # leftover digits mean a phrasing we did not model ("in 2 days", ranges, ...)
+    if not title or any(ch.isdigit() for ch in title) or _CAL_RE.search(title):
+        return None
+    words = re.findall(r"[a-z']+", title.lower())
+    if not words or words[-1] in _DANGLING_WORDS or words[0] in _NON_CREATE_VERBS:
+        return None
+    if not (_UNMODELLED_WORDS.isdisjoint(words) and _DATE_WORDS.isdisjoint(words)
+            and _TZ_WORDS.isdisjoint(words)):
+        return None
+
+    hint = lead.group("cal")
+    return {
+        "title": title[0].upper() + title[1:],
+        "calendar_hint": hint.capitalize() if hint else None,
+        "start_local": f"{date.isoformat()}T{hour:02d}:{minute:02d}",
+        "duration_minutes": duration,
+    }
+
+def _response_cache_key(user_text: str, now_local: str) -> str:
+    # day-relative phrasings ("tomorrow", "tonight") hold for the hour bucket;
+    # clock-relative ones key on the full minute the model is given
+    bucket = now_local if _CLOCK_RELATIVE_RE.search(user_text) else now_local[:13]
+    raw = f"{MODEL}|{' '.join(user_text.lower().split())}|{bucket}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+def _read_until_json_closes(r) -> str:
+    """Accumulate streamed message deltas, closing the response as soon as the
+    first top-level JSON object is balanced (the model is told to emit nothing after)."""
+    parts, raw = [], []
+    depth, in_str, esc, started = 0, False, False, False
+    # one iterator throughout: a second iter_lines() call would drop the
+    # lines the first one has already buffered
+    lines = r.iter_lines()
+    try:
+        for line in lines:
+            if not line:
+                continue
+            raw.append(line.decode("utf-8", "replace"))
+            try:
+                chunk = orjson.loads(line)
+                delta = chunk["message"]["content"]
+            except (ValueError, KeyError, TypeError):
+                # not Ollama chat chunks; parse whatever text we got
+                raw.extend(l.decode("utf-8", "replace") for l in lines)
+                return "\n".join(raw)
+            parts.append(delta)
+            for ch in delta:
+                if in_str:
+                    if esc:
+                        esc = False
+                    elif ch == "\\":
+                        esc = True
+                    elif ch == '"':
+                        in_str = False
+                elif ch == '"' and started:
+                    in_str = True
+                elif ch == "{":
+                    depth += 1
+                    started = True
+                elif ch == "}" and started:
+                    depth -= 1
+                    if depth == 0:
+                        return "".join(parts)
+            if chunk.get("done"):
+                break
+    finally:
+        r.close()
+    return "".join(parts)
+
+def _read_disk_cache(key: str):
+    path = LLM_CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime >= LLM_CACHE_TTL_S:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def _prune_disk_cache() -> None:
+    # entries are never read past the TTL, so delete them rather than let
+    # the directory grow with every distinct query
+    cutoff = time.time() - LLM_CACHE_TTL_S
+    for path in LLM_CACHE_DIR.glob("*.json"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+def _write_disk_cache(key: str, plan: dict) -> None:
+    try:
+        LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=LLM_CACHE_DIR, suffix=".tmp")
+    except OSError:
+        return  # cache is best-effort
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(plan))
+        os.replace(tmp, LLM_CACHE_DIR / f"{key}.json")
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return
+    _prune_disk_cache()
+
 def call_ollama(user_text: str, now_local: str, tzname: str) -> dict:
-    prompt = SYSTEM_PROMPT.replace("{NOW_LOCAL}", now_local).replace("{TZ}", tzname)
+    key = _response_cache_key(user_text, now_local)
+    if key in _RESPONSE_CACHE:
+        return dict(_RESPONSE_CACHE[key])
+    # minute-keyed replies are stale by the next run, so keep them off disk
+    persist = not _CLOCK_RELATIVE_RE.search(user_text)
+    plan = _read_disk_cache(key) if persist else None
+    if plan is not None:
+        _RESPONSE_CACHE[key] = plan
+        return dict(plan)
+
+    # keep the system prompt byte-identical across calls so Ollama can reuse
+    # its KV cache; the per-call context rides in the user message instead
     payload = {
         "model": MODEL,
         "messages": [
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": user_text}
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": f"now_local={now_local}\nTZ={tzname}\n---\n{user_text}"}
         ],
         "options": {"temperature": 0.1},
-        "stream": False  # IMPORTANT: disable streaming so .json() works
+        "stream": True  # read deltas so we can hang up once the JSON object closes
     }
-    r = requests.post(f"{OLLAMA_BASE}/api/chat", json=payload, timeout=120)
+    r = _SESSION.post(f"{OLLAMA_BASE}/api/chat", json=payload, timeout=120, stream=True)
     r.raise_for_status()
-
-    # Newer Ollama (non-stream) returns a single JSON with message.content
-    try:
-        data = r.json()
-        content = data["message"]["content"]
-    except Exception:
-        # If server still streamed or returned text, fall back to raw text parsing
-        content = r.text
+    content = _read_until_json_closes(r)
 
     # Extract strict JSON
-    json_str = extract_json_str(content)
-    return json.loads(json_str)
+    plan = extract_json(content)
+    _RESPONSE_CACHE[key] = plan
+    if persist:
+        _write_disk_cache(key, plan)
+    return dict(plan)
 
 def main():
     ap = argparse.ArgumentParser(
@@ -113,8 +375,13 @@ def main():
     ap.add_argument("text", help="e.g. 'Create a Home event for Oct 10, 2025 call with my uncle for 30 minutes'")
     args = ap.parse_args()
 
-    now_local = datetime.now(tz.gettz(TZNAME)).strftime("%Y-%m-%dT%H:%M")
-    plan = call_ollama(args.text, now_local, TZNAME)
+    now_dt = datetime.now(_TZ)
+    now_local = now_dt.strftime("%Y-%m-%dT%H:%M")
+    # read the calendar cache while the model is generating
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        cache_future = pool.submit(load_calendar_cache)
+        plan = _try_local_parse(args.text, now_dt) or call_ollama(args.text, now_local, TZNAME)
+        index_by_title_lc, cal_ids, cal_writable = cache_future.result()
 
     # Pull fields with sane defaults/validation
     print(plan)
@@ -131,15 +398,11 @@ def main():
     end_dt = start_dt + timedelta(minutes=dur)
 
     # Resolve calendar_id from cache if hint provided
-    _, by_title_lc = load_calendar_cache()
     calendar_id = None
     if cal_hint in ("work", "home"):
-        entry = by_title_lc.get(cal_hint)
-        if not entry:
-            # try exact titles “Work”/“Home” in lowercase map
-            entry = by_title_lc.get("work" if cal_hint == "work" else "home")
-        if entry and entry.get("writable"):
-            calendar_id = entry["id"]
+        i = index_by_title_lc.get(cal_hint)
+        if i is not None and cal_writable[i]:
+            calendar_id = cal_ids[i]
 
     payload = {
         "title": title,
@@ -151,9 +414,9 @@ def main():
         payload["calendar_id"] = calendar_id
 
     print("→ Creating event with payload:")
-    print(json.dumps(payload, indent=2))
+    print(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
 
-    cr = requests.post(f"{CALBRIDGE_BASE}/add", json=payload, timeout=15)
+    cr = _SESSION.post(f"{CALBRIDGE_BASE}/add", json=payload, timeout=15)
     print("CalBridge STATUS:", cr.status_code)
     print(cr.text)
 
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test the local fast path of nl_to_event (no Ollama or CalBridge needed)
+"""
+import sys
+import os
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from datetime import datetime
+from nl_to_event import _try_local_parse, _TZ
+
+# Friday, so "saturday" is tomorrow and "Monday" is three days out
+NOW = datetime(2026, 10, 16, 9, 30, tzinfo=_TZ)
+
+
+def test_simple_phrasings_parse_locally():
+    """Test phrasings inside the fast-path grammar are parsed without the model"""
+    print("🧪 TESTING LOCAL PARSE")
+    print("=" * 80)
+
+    cases = [
+        ("Call mom tomorrow at 3pm", {
+            "title": "Call mom", "calendar_hint": None,
+            "start_local": "2026-10-17T15:00", "duration_minutes": 30}),
+        ("Create a Home event for Oct 20 call with my uncle for 45 minutes", {
+            "title": "Call with my uncle", "calendar_hint": "Home",
+            "start_local": "2026-10-20T10:00", "duration_minutes": 45}),
+        ("Schedule a work event: standup next monday 9:15", {
+            "title": "Standup", "calendar_hint": "Work",
+            "start_local": "2026-10-26T09:15", "duration_minutes": 30}),
+        ("Dentist on Oct 10, 2027 in the afternoon", {
+            "title": "Dentist", "calendar_hint": None,
+            "start_local": "2027-10-10T15:00", "duration_minutes": 30}),
+        ("Dentist on sat at 4pm", {
+            "title": "Dentist", "calendar_hint": None,
+            "start_local": "2026-10-17T16:00", "duration_minutes": 30}),
+    ]
+
+    for text, expected in cases:
+        plan = _try_local_parse(text, NOW)
+        print(f"  '{text}' → {plan}")
+        assert plan == expected, text
+
+
+def test_ambiguous_phrasings_defer_to_model():
+    """Test phrasings outside the grammar return None so the model handles them"""
+    print("\n🔍 TESTING FALLBACK TO MODEL")
+    print("=" * 80)
+
+    cases = [
+        "Work out at the gym tomorrow 7am",     # "work" is a verb here
+        "Work on report tomorrow at 3pm",
+        "Home depot run saturday morning",      # "home" is part of a name
+        "Prepare deck by Friday",               # deadline, not a start
+        "Call mom every Monday at 9am",         # recurrence
+        "Submit taxes before April 15",         # deadline, and already past
+        "Meeting Oct 10",                       # past this year, no year given
+        "Call mom in 2 days",                   # leftover digits
+        "Lunch with Sam",                       # no date at all
+        "Lunch in the sun tomorrow at noon",    # "sun" is not Sunday
+        "Pick up sun screen tomorrow",
+        "Sat down with Bob tomorrow at 3pm",    # "sat" is not Saturday
+        "Meet Sam tomorrow or friday",          # two dates
+        "Call mom not tomorrow but friday",
+        "Call mom tomorrow at 3pm PST",         # explicit timezone
+        "Cancel meeting tomorrow",              # not a create request
+        "Delete dentist tomorrow",
+    ]
+
+    for text in cases:
+        plan = _try_local_parse(text, NOW)
+        print(f"  '{text}' → {plan}")
+        assert plan is None, text
+
+
+if __name__ == "__main__":
+    test_simple_phrasings_parse_locally()
+    test_ambiguous_phrasings_defer_to_model()
+    print("\n✅ All nl_to_event tests passed")
@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, date, time, timedelta
 from typing import List, Tuple, Dict, Optional
 from collections import defaultdict
+from functools import lru_cache
 
 # ----------------------------------------------------------------------
 # Utilities
@@ -31,6 +32,21 @@ def intersect(iv1: Tuple[datetime, datetime], iv2: Tuple[datetime, datetime]) ->
 def subtract_block(intervals: List[Tuple[datetime, datetime]],
                    s: datetime, e: datetime) -> List[Tuple[datetime, datetime]]:
     """Return intervals \ (s,e)."""
+    # Fast path: the usual input is already sorted with gaps between
+    # intervals (every result of this function is), and cutting a non-empty
+    # block out of such a list keeps it that way, so no sort/merge is needed
+    if s < e and all(x[1] < y[0] for x, y in zip(intervals, intervals[1:])):
+        out = []
+        for a,b in intervals:
+            if e <= a or s >= b:
+                out.append((a,b))
+            else:
+                if a < s:
+                    out.append((a, s))
+                if e < b:
+                    out.append((e, b))
+        return out
+
     out = []
     for a,b in intervals:
         if e <= a or s >= b:
@@ -40,15 +56,43 @@ def subtract_block(intervals: List[Tuple[datetime, datetime]],
                 out.append((a, s))
             if e < b:
                 out.append((e, b))
-    out.sort()
+    return merge_intervals(out)
+
+def merge_intervals(intervals: List[Tuple[datetime, datetime]]) -> List[Tuple[datetime, datetime]]:
+    """Sort intervals and merge any that overlap or touch."""
     merged = []
-    for iv in out:
+    for iv in sorted(intervals):
         if not merged or merged[-1][1] < iv[0]:
             merged.append(iv)
         else:
             merged[-1] = (merged[-1][0], max(merged[-1][1], iv[1]))
     return merged
 
+def subtract_blocks(intervals: List[Tuple[datetime, datetime]],
+                    blocks: List[Tuple[datetime, datetime]]) -> List[Tuple[datetime, datetime]]:
+    """Return intervals \ (union of blocks); same result as subtract_block per block."""
+    intervals = merge_intervals(intervals)
+    blocks = merge_intervals([(bs, be) for bs, be in blocks if bs < be])
+
+    # Both lists are sorted and disjoint, so one two-pointer sweep cuts every
+    # block out; j skips blocks that end before the current interval starts
+    out = []
+    j = 0
+    for a,b in intervals:
+        while j < len(blocks) and blocks[j][1] <= a:
+            j += 1
+        cur = a
+        k = j
+        while k < len(blocks) and blocks[k][0] < b:
+            bs, be = blocks[k]
+            if cur < bs:
+                out.append((cur, bs))
+            cur = max(cur, be)
+            k += 1
+        if cur < b:
+            out.append((cur, b))
+    return out
+
 def find_earliest_block(intervals: List[Tuple[datetime, datetime]], duration_min: int) -> Optional[Tuple[datetime, datetime]]:
     need = timedelta(minutes=duration_min)
     for a,b in intervals:
@@ -56,11 +100,21 @@ def find_earliest_block(intervals: List[Tuple[datetime, datetime]], duration_min
             return (a, a + need)
     return None
 
-def choose_even_spread_targets(num_tasks: int, num_days: int) -> List[int]:
+@lru_cache(maxsize=256)
+def choose_even_spread_targets(num_tasks: int, num_days: int) -> Tuple[int, ...]:
     """Return target day indices for even spacing across [0..num_days-1]."""
     if num_tasks == 1:
-        return [num_days // 2]
-    return [round(i * (num_days - 1) / (num_tasks - 1)) for i in range(num_tasks)]
+        return (num_days // 2,)
+    # round(i * (num_days-1) / (num_tasks-1)) in integers, keeping round()'s
+    # ties-to-even so the targets match the float version exactly
+    span, steps = num_days - 1, num_tasks - 1
+    targets = []
+    for i in range(num_tasks):
+        q, r = divmod(i * span, steps)
+        if 2 * r > steps or (2 * r == steps and q % 2):
+            q += 1
+        targets.append(q)
+    return tuple(targets)
 
 # ----------------------------------------------------------------------
 # Constraints
@@ -94,10 +148,14 @@ class ConstraintAdder:
 
     def apply_blackouts(self, day_windows: Dict[date, List[Tuple[datetime, datetime]]]) -> None:
         """Subtract blackout windows from day availability, in-place."""
+        # Nothing to cut (the usual case for the agents): skip the per-day walk
+        if not any(self.weekly_blackouts.values()) and not any(self.date_blackouts.values()):
+            return
+
         for d, intervals in list(day_windows.items()):
             # Build blackout intervals (as datetimes) for this date
             blocks: List[Tuple[datetime, datetime]] = []
-            weekday = datetime.combine(d, time(0,0)).weekday()
+            weekday = d.weekday()
 
             for st, et in self.weekly_blackouts.get(weekday, []):
                 blocks.append((datetime.combine(d, st), datetime.combine(d, et)))
@@ -105,26 +163,9 @@ class ConstraintAdder:
             for st, et in self.date_blackouts.get(d, []):
                 blocks.append((datetime.combine(d, st), datetime.combine(d, et)))
 
-            # Subtract all blocks
-            for bs, be in blocks:
-                new_intervals = []
-                for a,b in intervals:
-                    if be <= a or bs >= b:
-                        new_intervals.append((a,b))
-                    else:
-                        if a < bs:
-                            new_intervals.append((a, bs))
-                        if be < b:
-                            new_intervals.append((be, b))
-                new_intervals.sort()
-                # merge
-                merged = []
-                for iv in new_intervals:
-                    if not merged or merged[-1][1] < iv[0]:
-                        merged.append(iv)
-                    else:
-                        merged[-1] = (merged[-1][0], max(merged[-1][1], iv[1]))
-                intervals = merged
+            # Subtract all blocks in one sweep
+            if blocks:
+                intervals = subtract_blocks(intervals, blocks)
 
             day_windows[d] = intervals
 
@@ -132,12 +173,12 @@ class ConstraintAdder:
 # Scheduler
 # ----------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleOptions:
     work_start_hour: int = 6   # 6 AM
     work_end_hour: int = 23    # 11 PM
 
-@dataclass
+@dataclass(slots=True)
 class Assignment:
     task_id: int
     duration_min: int
@@ -165,37 +206,29 @@ def schedule_ordered_with_constraints(
     """
     constraints = constraints or ConstraintAdder()
     deadline = datetime.fromisoformat(deadline_iso)
-    slots = [(datetime.fromisoformat(a), datetime.fromisoformat(b)) for a,b in raw_slots]
 
-    # 1) Build per-day availability from slots:
-    pieces: List[Tuple[datetime, datetime]] = []
-    for a,b in slots:
+    # 1) Build per-day availability in one pass over the slots: split at
+    #    midnight, cap to deadline, intersect with the daily work window
+    workday_windows: Dict[date, List[Tuple[datetime, datetime]]] = defaultdict(list)
+    for raw_a, raw_b in raw_slots:
+        a, b = datetime.fromisoformat(raw_a), datetime.fromisoformat(raw_b)
         if a >= b:
             continue
-        pieces.extend(split_interval_by_midnight(a, b))
-
-    # Cap to deadline
-    capped: List[Tuple[datetime, datetime]] = []
-    for a,b in pieces:
-        if a >= deadline:
-            continue
-        capped.append((a, min(b, deadline)))
-
-    # Intersect with daily work window
-    workday_windows: Dict[date, List[Tuple[datetime, datetime]]] = defaultdict(list)
-    for a,b in capped:
-        d0 = day_start(a)
-        work_window = (d0 + timedelta(hours=options.work_start_hour),
-                       d0 + timedelta(hours=options.work_end_hour))
-        inter = intersect((a,b), work_window)
-        if inter:
-            workday_windows[d0.date()].append(inter)
-
-    # Clean empty days & sort daily intervals
-    for k in list(workday_windows.keys()):
-        workday_windows[k].sort()
-        if not workday_windows[k]:
-            del workday_windows[k]
+        for pa, pb in split_interval_by_midnight(a, b):
+            if pa >= deadline:
+                break  # pieces are chronological; the rest are later still
+            d0 = day_start(pa)
+            work_window = (d0 + timedelta(hours=options.work_start_hour),
+                           d0 + timedelta(hours=options.work_end_hour))
+            inter = intersect((pa, min(pb, deadline)), work_window)
+            if inter:
+                workday_windows[d0.date()].append(inter)
+
+    # Sort daily intervals. Slots normally arrive in order, and list.sort()
+    # confirms a sorted run in one C-level pass, cheaper than checking in
+    # Python first. Days only exist once a piece was appended, so none are empty.
+    for intervals in workday_windows.values():
+        intervals.sort()
 
     # 2) Apply extra blackouts (weekly/date)
     constraints.apply_blackouts(workday_windows)
@@ -210,44 +243,75 @@ def schedule_ordered_with_constraints(
     if total_avail_min < total_need_min:
         raise RuntimeError(f"Infeasible: need {total_need_min} min but only {total_avail_min} min available.")
 
+    # Drop intervals too short for even the shortest task: find_earliest_block
+    # would skip them for every task anyway. Ones touching a neighbour are
+    # kept, since subtract_block may merge them into a usable interval.
+    if tasks_min:
+        shortest = timedelta(minutes=min(tasks_min))
+        for d in eligible_days:
+            intervals = workday_windows[d]
+            kept = []
+            reach = None  # latest end among earlier intervals
+            for k, (a, b) in enumerate(intervals):
+                touches = (reach is not None and reach >= a) or \
+                    (k + 1 < len(intervals) and intervals[k + 1][0] <= b)
+                if b - a >= shortest or touches:
+                    kept.append((a, b))
+                reach = b if reach is None else max(reach, b)
+            workday_windows[d] = kept
+
     # 4) Even-spread target days
     targets = choose_even_spread_targets(len(tasks_min), len(eligible_days))
 
     # 5) Greedy placement in order
     assignments: List[Assignment] = []
     per_day_count: Dict[date, int] = {d: 0 for d in eligible_days}
+    num_days = len(eligible_days)
+    # Constraint settings are fixed for the run; resolve them once here
+    cap = constraints.max_tasks_per_day
+    cooldown = timedelta(minutes=constraints.min_gap_minutes)
+    # Longest free interval per day, so days that cannot fit a task are
+    # skipped without scanning their fragments
+    day_max_len: Dict[date, timedelta] = {
+        d: max((b - a for a, b in workday_windows[d]), default=timedelta(0))
+        for d in eligible_days
+    }
 
     for idx, (dur, target_idx) in enumerate(zip(tasks_min, targets)):
         placed = False
-
-        # Rank candidate days
-        ranked_days = sorted(
-            eligible_days,
-            key=lambda d: (abs(eligible_days.index(d) - target_idx), per_day_count[d])
-        )
-
-        for day_key in ranked_days:
-            # Max per day
-            if constraints.max_tasks_per_day is not None and per_day_count[day_key] >= constraints.max_tasks_per_day:
-                continue
-
-            block = find_earliest_block(workday_windows[day_key], dur)
-            if not block:
-                continue
-
-            s, e = block
-            assignments.append(Assignment(task_id=idx, duration_min=dur, day=day_key, start=s, end=e))
-            # subtract
-            workday_windows[day_key] = subtract_block(workday_windows[day_key], s, e)
-
-            # cooldown
-            if constraints.min_gap_minutes > 0:
-                cool_s, cool_e = e, e + timedelta(minutes=constraints.min_gap_minutes)
-                workday_windows[day_key] = subtract_block(workday_windows[day_key], cool_s, cool_e)
-
-            per_day_count[day_key] += 1
-            placed = True
-            break
+        need = timedelta(minutes=dur)
+
+        # Rank candidate days by distance from the target, fewest tasks first
+        # among equals. Walking outward ring by ring gives the same order as
+        # sorting every day, but stops at the first day that fits.
+        for dist in range(num_days):
+            ring = [eligible_days[i] for i in {target_idx - dist, target_idx + dist} if 0 <= i < num_days]
+            ring.sort(key=lambda d: (per_day_count[d], d))
+
+            for day_key in ring:
+                # Max per day
+                if cap is not None and per_day_count[day_key] >= cap:
+                    continue
+                if day_max_len[day_key] < need:
+                    continue
+
+                block = find_earliest_block(workday_windows[day_key], dur)
+                if not block:
+                    continue
+
+                s, e = block
+                assignments.append(Assignment(task_id=idx, duration_min=dur, day=day_key, start=s, end=e))
+                # subtract the task and its cooldown (same day) in one cut;
+                # the two blocks touch, so this equals subtracting each
+                workday_windows[day_key] = subtract_block(workday_windows[day_key], s, e + cooldown)
+                day_max_len[day_key] = max((b - a for a, b in workday_windows[day_key]), default=timedelta(0))
+
+                per_day_count[day_key] += 1
+                placed = True
+                break
+
+            if placed:
+                break
 
         if not placed:
             raise RuntimeError(f"Could not place task index {idx} ({dur} min) before deadline with current constraints.")